@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import ssl
@@ -145,8 +146,8 @@ async def check_balance(client_address: str, job_amount: float) -> Dict:
         # Normalize RPC URL
         rpc_url = _normalize_rpc_url(rpc_url)
         
-        # Get current balance
-        balance = _get_gas_balance(rpc_url, client_address)
+        # Get current balance (blocking urlopen, run in a worker thread)
+        balance = await asyncio.to_thread(_get_gas_balance, rpc_url, client_address)
         
         # Calculate required amount (job + network fee buffer)
         required = job_amount + BankerConfig.NETWORK_FEE_BUFFER
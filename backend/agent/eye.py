@@ -13,6 +13,11 @@ from backend.agent.paralegal import get_ai_client
 from backend.config import AgentConfig
 
 
+def _encode_base64(image_bytes: bytes) -> str:
+    """Base64-encode image bytes for data URLs"""
+    return base64.b64encode(image_bytes).decode('utf-8')
+
+
 class UniversalEyeAgent:
     """
     Generalized verification agent that works for ANY gig work type
@@ -154,19 +159,11 @@ class UniversalEyeAgent:
         
         print("📥 Downloading images for visual comparison...")
         
-        # Step 1: Download reference photos
-        reference_images_b64 = []
-        for url in reference_photos:
-            img_b64 = await self._download_and_encode_image(url)
-            if img_b64:
-                reference_images_b64.append(img_b64)
-        
-        # Step 2: Download proof photos
-        proof_images_b64 = []
-        for url in proof_photos:
-            img_b64 = await self._download_and_encode_image(url)
-            if img_b64:
-                proof_images_b64.append(img_b64)
+        # Step 1 & 2: Download reference and proof photos concurrently
+        reference_images_b64, proof_images_b64 = await asyncio.gather(
+            self._download_and_encode_images(reference_photos),
+            self._download_and_encode_images(proof_photos)
+        )
         
         if not reference_images_b64 or not proof_images_b64:
             print("⚠️ Could not download images, falling back to URL-based analysis")
@@ -381,12 +378,8 @@ BEFORE PHOTOS (Reference):"""
         
         # Download proof images
         print("📥 Downloading proof images for quality verification...")
-        proof_images_b64 = []
         print(proof_photos)
-        for url in proof_photos:
-            img_b64 = await self._download_and_encode_image(url)
-            if img_b64:
-                proof_images_b64.append(img_b64)
+        proof_images_b64 = await self._download_and_encode_images(proof_photos)
         
         if not proof_images_b64:
             print("⚠️ Could not download proof images, using comparison data only")
@@ -1005,7 +998,7 @@ Return ONLY valid JSON:
             
             # Encode as base64
             image_bytes = response.content
-            image_b64 = base64.b64encode(image_bytes).decode('utf-8')
+            image_b64 = _encode_base64(image_bytes)
             
             return image_b64
             
@@ -1013,6 +1006,16 @@ Return ONLY valid JSON:
             print(f"⚠️ Failed to download/encode image {url}: {e}")
             return None
     
+    async def _download_and_encode_images(self, urls: List[str]) -> List[str]:
+        """
+        Download and encode several images concurrently
+        
+        Returns:
+            Base64 strings for the images that succeeded, in input order
+        """
+        results = await asyncio.gather(*(self._download_and_encode_image(url) for url in urls))
+        return [img_b64 for img_b64 in results if img_b64]
+    
     async def _compare_without_vision(
         self,
         reference_photos: List[str],
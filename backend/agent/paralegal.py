@@ -3,15 +3,18 @@
 Uses native Sudo AI SDK for production-ready, type-safe AI integration.
 Supports structured JSON output with schema validation.
 """
+import asyncio
+import copy
+import hashlib
 import json
 import os
 import base64
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
 from typing import List, Dict, Any, Optional
-from dotenv import load_dotenv
 from sudo_ai import Sudo
-from backend.config import AgentConfig
-
-load_dotenv()
+from backend.config import AgentConfig  # loads .env on import
 
 
 # ==================== AI CLIENT (MODULAR - SUDO SDK) ====================
@@ -187,6 +190,18 @@ class ParalegalConfig:
     REQUIRED_FIELDS = ["task", "task_description", "location", "price_amount", "price_currency"]
 
 
+# Set when an analysis step falls back to a default result after an AI call
+# failed. Each analysis task runs in its own copy of the context, so the flag
+# covers exactly one analysis; such results are not cached (see _run_analysis).
+_analysis_degraded: ContextVar[bool] = ContextVar("_analysis_degraded", default=False)
+
+
+def _degraded(fallback):
+    """Return a step's fallback result, marking the current analysis as degraded"""
+    _analysis_degraded.set(True)
+    return fallback
+
+
 async def validate_clarity(text: str, extracted_data: dict) -> dict:
     """
     Validate if job description is clear and complete.
@@ -244,12 +259,12 @@ Your response will be automatically parsed as JSON matching the schema provided.
         
     except Exception:
         if has_task and has_description and has_location and has_price:
-            return {"is_clear": True, "issues": [], "questions": []}
-        return {
+            return _degraded({"is_clear": True, "issues": [], "questions": []})
+        return _degraded({
             "is_clear": False,
             "issues": ["Could not validate clarity"],
             "questions": ["Please provide more details about the task and location"]
-        }
+        })
 
 
 async def verify_image_match(text: str, task: str, task_description: str, image_bytes: bytes, mime_type: str = "image/jpeg") -> dict:
@@ -314,12 +329,12 @@ Your response will be automatically parsed as JSON matching the schema provided.
         return result
         
     except Exception as e:
-        return {
+        return _degraded({
             "match": True,
             "confidence": 0.5,
             "image_shows": f"Vision analysis failed: {str(e)}",
             "mismatch_reason": None
-        }
+        })
 
 
 async def generate_verification_plan(task: str, task_description: str) -> dict:
@@ -370,7 +385,7 @@ Your response will be automatically parsed as JSON matching the schema provided.
         return json.loads(content)
         
     except Exception:
-        return {
+        return _degraded({
             "task_category": "general",
             "expected_transformation": {
                 "before": "work not completed",
@@ -384,7 +399,7 @@ Your response will be automatically parsed as JSON matching the schema provided.
             ],
             "common_mistakes": ["showing different location", "hiding incomplete work"],
             "required_evidence": ["full work area visible", "same location as reference photo"]
-        }
+        })
 
 
 async def generate_acceptance_criteria(task: str, location: str) -> List[str]:
@@ -418,16 +433,76 @@ Return ONLY a JSON array of criteria strings:
         
         if isinstance(criteria, list):
             return criteria
-        return ["Task must be completed as described", "Proof photo required"]
+        return _degraded(["Task must be completed as described", "Proof photo required"])
     except Exception:
-        return [
+        return _degraded([
             "Task must be completed as described in the job description",
             "Proof photo must clearly show the completed work",
             "Photo must be taken in good lighting conditions"
-        ]
+        ])
+
+
+# Retries and frontend re-submits send the same image + message again; reuse
+# the earlier analysis instead of repeating every AI call
+_ANALYSIS_CACHE_SIZE = 256
+_ANALYSIS_CACHE_TTL = 600  # seconds
+_analysis_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_analysis_inflight: Dict[bytes, asyncio.Task] = {}
+
+
+def _analysis_key(text: str, reference_image: bytes, location: Optional[str], mime_type: str) -> bytes:
+    extra = "\0".join((text, location or "", mime_type or ""))
+    return hashlib.sha256(reference_image).digest() + extra.encode("utf-8")
+
+
+async def _run_analysis(text: str, reference_image: bytes, location: Optional[str], mime_type: str) -> tuple:
+    """Run _analyze_job_request (as its own task) and report whether any step fell back"""
+    result = await _analyze_job_request(text, reference_image, location, mime_type)
+    return result, _analysis_degraded.get()
+
+
+def _store_analysis(key: bytes, task: asyncio.Task) -> None:
+    _analysis_inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    result, degraded = task.result()
+    if degraded:
+        # An AI call failed and a default was used; let a retry try again
+        return
+    _analysis_cache[key] = (time.monotonic(), result)
+    _analysis_cache.move_to_end(key)
+    if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
 
 
 async def analyze_job_request(text: str, reference_image: bytes, location: str = None, mime_type: str = "image/jpeg") -> dict:
+    """
+    Analyze a job request, reusing recent results for identical input.
+
+    Concurrent calls with the same input share a single analysis. Results
+    where an AI call failed and a step fell back to defaults aren't cached.
+    See _analyze_job_request for arguments and the result format.
+    """
+    key = _analysis_key(text, reference_image, location, mime_type)
+
+    cached = _analysis_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _ANALYSIS_CACHE_TTL:
+        _analysis_cache.move_to_end(key)
+        return copy.deepcopy(cached[1])
+
+    # Check-and-insert has no await in between, so it is atomic on the event loop
+    task = _analysis_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_run_analysis(text, reference_image, location, mime_type))
+        _analysis_inflight[key] = task
+        task.add_done_callback(lambda t: _store_analysis(key, t))
+
+    # shield: one caller disconnecting must not cancel the analysis others are awaiting
+    result, _ = await asyncio.shield(task)
+    return copy.deepcopy(result)
+
+
+async def _analyze_job_request(text: str, reference_image: bytes, location: str = None, mime_type: str = "image/jpeg") -> dict:
     """
     Intelligent job analysis with validation and criteria generation.
     
@@ -566,14 +641,14 @@ Your response will be automatically parsed as JSON matching the schema provided.
         
     except Exception as e:
         print(f"❌ Extraction error: {str(e)}")
-        return {
+        return _degraded({
             "task": None,
             "task_description": None,
             "location": None,
             "price_amount": None,
             "price_currency": None,
             "missing_fields": ["task", "task_description", "location", "price_amount", "price_currency"]
-        }
+        })
 
 
 async def analyze_reference_photo(image_bytes: bytes) -> dict:
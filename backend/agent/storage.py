@@ -1,23 +1,125 @@
+import asyncio
 import os
 import time
+import hashlib
+import json
+import logging
+import httpx
 import requests
-from typing import Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import AsyncIterator, Iterator, Optional, Tuple
 from dotenv import load_dotenv
+from urllib3.fields import format_multipart_header_param
 
 load_dotenv()  # Loads from root .env
 
-def upload_to_ipfs(image_bytes: bytes, filename: str = "proof.jpg", max_retries: int = 3) -> Optional[str]:
+logger = logging.getLogger("gigsmartpay.storage")
+
+# Shared HTTP session so repeated uploads reuse the TCP/TLS connection to Pinata
+_session: Optional[requests.Session] = None
+
+def _get_session() -> requests.Session:
+    """Get or create the shared Pinata HTTP session"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+# Async counterpart for callers on the event loop (one keep-alive pool)
+_async_client: Optional[httpx.AsyncClient] = None
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Get or create the shared async Pinata HTTP client"""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient()
+    return _async_client
+
+async def close_async_client() -> None:
+    """Close the shared async Pinata client (call on shutdown)"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+PINATA_PIN_FILE_URL = "https://api.pinata.cloud/pinning/pinFileToIPFS"
+
+# IPFS is content-addressed: identical bytes always pin to the same CID, so
+# re-uploads of a photo (retries, resubmissions) can reuse the earlier URL
+_UPLOAD_CACHE_SIZE = 256
+_upload_cache: "OrderedDict[str, str]" = OrderedDict()
+_upload_cache_lock = Lock()
+
+class _MultipartBody:
     """
-    Upload image bytes to IPFS via Pinata API
+    multipart/form-data body streamed from the caller's bytes.
     
-    Args:
-        image_bytes: Raw image bytes to upload
-        filename: Name to give the file
-        max_retries: Maximum number of retry attempts
-    
-    Returns:
-        Public IPFS URL if successful, None otherwise
+    requests' files= encoder joins every part into one new bytes object, a
+    full copy of the image. Passed as data=, this is sent part by part
+    (with a Content-Length from __len__), slicing the image through a
+    memoryview instead of copying it. Re-iterable, so retries can resend it.
     """
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, fields: dict, file_field: str, filename: str, content: bytes, content_type: str):
+        self.boundary = os.urandom(16).hex()
+        parts = []
+        for name, value in fields.items():
+            parts.append(
+                f"--{self.boundary}\r\nContent-Disposition: form-data; "
+                f"{format_multipart_header_param('name', name)}\r\n\r\n{value}\r\n"
+            )
+        # The filename comes from the user's upload: urllib3's escaping (as its
+        # encoder did) percent-encodes CR, LF and '"' so it can't end the header line
+        parts.append(
+            f"--{self.boundary}\r\nContent-Disposition: form-data; "
+            f"{format_multipart_header_param('name', file_field)}; "
+            f"{format_multipart_header_param('filename', filename)}\r\n"
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._head = "".join(parts).encode("utf-8")
+        self._content = memoryview(content)
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+    
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+    
+    def __len__(self) -> int:
+        return len(self._head) + len(self._content) + len(self._tail)
+    
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        for start in range(0, len(self._content), self.CHUNK_SIZE):
+            yield self._content[start:start + self.CHUNK_SIZE]
+        yield self._tail
+    
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """Same parts as __iter__, for httpx.AsyncClient (content=body.aiter())"""
+        for part in self:
+            yield part
+
+
+def _cached_upload(content_hash: str) -> Optional[str]:
+    with _upload_cache_lock:
+        cached_url = _upload_cache.get(content_hash)
+        if cached_url:
+            _upload_cache.move_to_end(content_hash)
+    if cached_url:
+        logger.debug("Reusing IPFS URL for identical content: %s", cached_url)
+    return cached_url
+
+
+def _remember_upload(content_hash: str, public_url: str) -> None:
+    with _upload_cache_lock:
+        _upload_cache[content_hash] = public_url
+        if len(_upload_cache) > _UPLOAD_CACHE_SIZE:
+            _upload_cache.popitem(last=False)
+
+
+def _build_pinata_request(image_bytes: bytes, filename: str) -> Optional[Tuple[dict, _MultipartBody]]:
+    """Headers and multipart body for a Pinata pin, or None if credentials are missing"""
     pinata_jwt = os.getenv("PINATA_JWT")
     pinata_api_key = os.getenv("PINATA_API_KEY")
     pinata_secret_key = os.getenv("PINATA_SECRET_KEY")
@@ -25,8 +127,6 @@ def upload_to_ipfs(image_bytes: bytes, filename: str = "proof.jpg", max_retries:
     if not pinata_jwt and not (pinata_api_key and pinata_secret_key):
         print("❌ Error: Missing Pinata credentials in .env")
         return None
-
-    url = "https://api.pinata.cloud/pinning/pinFileToIPFS"
     
     # Headers
     headers = {}
@@ -37,11 +137,6 @@ def upload_to_ipfs(image_bytes: bytes, filename: str = "proof.jpg", max_retries:
         headers["pinata_api_key"] = pinata_api_key
         headers["pinata_secret_api_key"] = pinata_secret_key
 
-    # File payload
-    files = {
-        'file': (filename, image_bytes, 'image/jpeg')
-    }
-    
     # Metadata & Options
     pinata_options = {
         "cidVersion": 1
@@ -50,35 +145,64 @@ def upload_to_ipfs(image_bytes: bytes, filename: str = "proof.jpg", max_retries:
     group_id = os.getenv("PINATA_GROUP_ID")
     if group_id:
         pinata_options["groupId"] = group_id
-        
-    data = {
-        "pinataOptions": str(pinata_options).replace("'", '"')  # JSON string required for options, simplified hack
-    }
-    # Better approach for JSON field in multipart:
-    import json
-    data = {"pinataOptions": json.dumps(pinata_options)}
+    
+    # Multipart payload: options as a JSON form field, then the file
+    body = _MultipartBody(
+        {"pinataOptions": json.dumps(pinata_options)},
+        "file", filename, image_bytes, "image/jpeg"
+    )
+    headers["Content-Type"] = body.content_type
+    return headers, body
+
+
+def _pinned_url(result: dict) -> Optional[str]:
+    """Gateway URL from a successful Pinata response"""
+    ipfs_hash = result.get('IpfsHash')
+    if not ipfs_hash:
+        print(f"❌ Error: No IpfsHash in Pinata response: {result}")
+        return None
+    # Use Pinata Gateway
+    public_url = f"https://gateway.pinata.cloud/ipfs/{ipfs_hash}"
+    logger.debug("Uploaded to Pinata: %s", public_url)
+    return public_url
+
+
+def upload_to_ipfs(image_bytes: bytes, filename: str = "proof.jpg", max_retries: int = 3) -> Optional[str]:
+    """
+    Upload image bytes to IPFS via Pinata API
+    
+    Args:
+        image_bytes: Raw image bytes to upload
+        filename: Name to give the file
+        max_retries: Maximum number of retry attempts
+    
+    Returns:
+        Public IPFS URL if successful, None otherwise
+    """
+    pinata_request = _build_pinata_request(image_bytes, filename)
+    if pinata_request is None:
+        return None
+    headers, body = pinata_request
+
+    content_hash = hashlib.sha256(image_bytes).hexdigest()
+    cached_url = _cached_upload(content_hash)
+    if cached_url:
+        return cached_url
 
     last_error = None
     file_size = len(image_bytes)
 
     for attempt in range(max_retries):
         try:
-            print(f"[IPFS] Upload attempt {attempt + 1}/{max_retries} - Uploading {file_size} bytes to Pinata...")
+            logger.debug("Upload attempt %d/%d - uploading %d bytes to Pinata", attempt + 1, max_retries, file_size)
             
-            # Need to re-create files dict per attempt if reading from stream, but bytes is safe to reuse? 
-            # Requests 'files' param handles bytes directly.
-            response = requests.post(url, files=files, data=data, headers=headers, timeout=60)
+            response = _get_session().post(PINATA_PIN_FILE_URL, data=body, headers=headers, timeout=60)
             
             if response.status_code == 200:
-                result = response.json()
-                ipfs_hash = result.get('IpfsHash')
-                if ipfs_hash:
-                    # Use Pinata Gateway
-                    public_url = f"https://gateway.pinata.cloud/ipfs/{ipfs_hash}"
-                    print(f"✅ Successfully uploaded to Pinata: {public_url}")
+                public_url = _pinned_url(response.json())
+                if public_url:
+                    _remember_upload(content_hash, public_url)
                     return public_url
-                else:
-                    print(f"❌ Error: No IpfsHash in Pinata response: {result}")
             else:
                 last_error = f"HTTP {response.status_code}: {response.text}"
                 print(f"⚠️ Pinata upload failed: {last_error}")
@@ -94,8 +218,72 @@ def upload_to_ipfs(image_bytes: bytes, filename: str = "proof.jpg", max_retries:
             wait_time = (2 ** attempt)
             print(f"Waiting {wait_time}s before retry...")
             time.sleep(wait_time)
-            # Re-initialize files tuple just in case requests closed it? (Unlikely for bytes, but safe)
-            files = {'file': (filename, image_bytes, 'image/jpeg')}
+
+    print(f"❌ Failed to upload to Pinata after {max_retries} attempts. Last error: {last_error}")
+    return None
+
+async def upload_to_ipfs_async(
+    image_bytes: bytes,
+    filename: str = "proof.jpg",
+    max_retries: int = 3,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[str]:
+    """
+    Async upload_to_ipfs: same request, retries and cache, but sent with
+    httpx on the event loop (no worker thread, non-blocking backoff).
+    
+    Args:
+        image_bytes: Raw image bytes to upload
+        filename: Name to give the file
+        max_retries: Maximum number of retry attempts
+        client: AsyncClient to send with (default: the shared keep-alive client)
+    
+    Returns:
+        Public IPFS URL if successful, None otherwise
+    """
+    pinata_request = _build_pinata_request(image_bytes, filename)
+    if pinata_request is None:
+        return None
+    headers, body = pinata_request
+    # Explicit length so httpx sends the streamed body without chunked encoding
+    headers["Content-Length"] = str(len(body))
+
+    # hashlib releases the GIL; hash multi-MB images off the event loop
+    content_hash = (await asyncio.to_thread(hashlib.sha256, image_bytes)).hexdigest()
+    cached_url = _cached_upload(content_hash)
+    if cached_url:
+        return cached_url
+
+    client = client or _get_async_client()
+    last_error = None
+    file_size = len(image_bytes)
+
+    for attempt in range(max_retries):
+        try:
+            logger.debug("Upload attempt %d/%d - uploading %d bytes to Pinata", attempt + 1, max_retries, file_size)
+            
+            response = await client.post(PINATA_PIN_FILE_URL, content=body.aiter(), headers=headers, timeout=60)
+            
+            if response.status_code == 200:
+                public_url = _pinned_url(response.json())
+                if public_url:
+                    _remember_upload(content_hash, public_url)
+                    return public_url
+            else:
+                last_error = f"HTTP {response.status_code}: {response.text}"
+                print(f"⚠️ Pinata upload failed: {last_error}")
+
+        except httpx.HTTPError as e:
+            last_error = str(e)
+            print(f"⚠️ Network error uploading to Pinata: {e}")
+        except Exception as e:
+            last_error = str(e)
+            print(f"⚠️ Unexpected error uploading to Pinata: {e}")
+            
+        if attempt < max_retries - 1:
+            wait_time = (2 ** attempt)
+            print(f"Waiting {wait_time}s before retry...")
+            await asyncio.sleep(wait_time)
 
     print(f"❌ Failed to upload to Pinata after {max_retries} attempts. Last error: {last_error}")
     return None
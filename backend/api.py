@@ -8,18 +8,27 @@ load_dotenv()
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends, WebSocket, WebSocketDisconnect, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict
 import asyncio
+import hashlib
 import json
+import orjson
 import os
 import time
 import logging
 from collections import defaultdict
 from threading import Lock
 
+# Per-request diagnostics (uploads, WebSocket churn) go through logging so they
+# cost nothing unless LOG_LEVEL=DEBUG; startup and error output stays on print
+logger = logging.getLogger("gigsmartpay.api")
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
 # Internal imports  
 from backend.database import Database
 
@@ -30,12 +39,12 @@ def get_db():
     """Dependency to get database instance"""
     return db
 
-from backend.agent.paralegal import analyze_job_request
+from backend.agent.paralegal import analyze_job_request, get_ai_client
 from backend.agent.eye import UniversalEyeAgent, verify_work
-from backend.agent.storage import upload_to_ipfs
+from backend.agent.storage import upload_to_ipfs_async, close_async_client as close_ipfs_client
 from backend.agent.banker import check_balance
 from backend.agent.conversational_job_creator import get_conversation_engine
-from src.neo_mcp import NeoMCP
+from src.neo_mcp import NeoMCP, close_shared_rpc_clients
 from scripts.check_balances import get_gas_balance
 
 
@@ -146,6 +155,73 @@ def get_validated_address(address: str) -> str:
     """FastAPI dependency for validated Neo N3 address"""
     return validate_neo_address(address)
 
+# ==================== UPLOAD HELPERS ====================
+
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB
+
+async def read_upload_limited(
+    file: UploadFile,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    too_large_detail: str = "File too large. Maximum size is 10MB"
+) -> bytes:
+    """Read an upload into a single bytes object, rejecting it if it exceeds max_bytes"""
+    # The body is already spooled by Starlette; its recorded size lets
+    # oversized files be rejected without reading them at all
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=400, detail=too_large_detail)
+    # One bounded read straight from the spool: no chunk buffer to grow and
+    # copy again, and never more than max_bytes + 1 in memory
+    await file.seek(0)
+    data = await file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise HTTPException(status_code=400, detail=too_large_detail)
+    return data
+
+async def pin_upload_to_ipfs(file: UploadFile, filename: Optional[str] = None) -> str:
+    """
+    Shared upload path for the IPFS and proof endpoints: bounded read,
+    empty check, then the async Pinata upload.
+    Returns the public IPFS URL or raises HTTPException.
+    """
+    file_bytes = await read_upload_limited(file)
+    logger.debug(
+        "IPFS upload request: %s (%s, %d bytes)",
+        file.filename, file.content_type, len(file_bytes)
+    )
+    
+    if len(file_bytes) == 0:
+        raise HTTPException(status_code=400, detail="File is empty")
+    
+    if filename is None:
+        # Unique name with timestamp to reduce collision probability
+        extension = file.filename.split('.')[-1] if file.filename and '.' in file.filename else 'jpg'
+        filename = f"upload_{int(time.time())}_{os.urandom(4).hex()}.{extension}"
+    
+    ipfs_url = await upload_to_ipfs_async(file_bytes, filename)
+    if not ipfs_url:
+        print(f"❌ IPFS upload returned None for {filename}")
+        raise HTTPException(status_code=500, detail="Failed to upload to IPFS - upload_to_ipfs_async() returned None")
+    
+    logger.debug("IPFS upload successful: %s -> %s", filename, ipfs_url)
+    return ipfs_url
+
+# ==================== CONDITIONAL GET (ETAG) ====================
+
+def etag_json_response(request: Request, payload: dict) -> Response:
+    """
+    Serialize payload as JSON with a content-hash ETag.
+    Returns 304 Not Modified when the client's If-None-Match still matches,
+    so polling clients skip re-downloading and re-rendering unchanged lists.
+    """
+    # orjson handles the row dicts natively; jsonable_encoder only sees odd types
+    body = orjson.dumps(payload, default=jsonable_encoder)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # ==================== VALIDATION MODELS ====================
 
 class VerificationPlan(BaseModel):
@@ -277,6 +353,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON job lists (polled frequently, compress well); small bodies skip it
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Initialize services
 db = get_db()
 mcp = NeoMCP()
@@ -299,7 +378,7 @@ class ConnectionManager:
         await websocket.accept()
         with self.lock:
             self.active_connections[client_id].append(websocket)
-        print(f"🔌 WebSocket connected: {client_id} (total: {len(self.active_connections[client_id])})")
+        logger.debug("WebSocket connected: %s (total: %d)", client_id, len(self.active_connections[client_id]))
     
     def disconnect(self, client_id: str, websocket: WebSocket):
         """Disconnect a client"""
@@ -313,7 +392,7 @@ class ConnectionManager:
                 # Delete key only if list is empty
                 if not self.active_connections[client_id]:
                     del self.active_connections[client_id]
-        print(f"🔌 WebSocket disconnected: {client_id}")
+        logger.debug("WebSocket disconnected: %s", client_id)
     
     async def broadcast_to_client(self, client_id: str, message: dict):
         """Send message to all connections for a specific client"""
@@ -358,6 +437,16 @@ async def startup_recovery():
     db = Database()
     print("✅ Database connection initialized")
     
+    # Derive the agent's signing key now rather than on the first payment release
+    mcp.warm_up()
+    
+    # Same for the shared AI client used by the paralegal, eye and job-creator agents
+    try:
+        get_ai_client()
+        print("✅ AI client initialized")
+    except Exception as e:
+        print(f"⚠️  AI client warm-up failed, will retry on first request: {e}")
+    
     print("🔄 Starting recovery scan for pending jobs...")
     
     try:
@@ -396,6 +485,13 @@ async def startup_recovery():
         logging.exception("Recovery failed")
         # Don't crash the server on recovery failure
 
+
+@app.on_event("shutdown")
+async def close_rpc_clients():
+    """Close the keep-alive Neo RPC session and the Pinata upload client"""
+    await close_shared_rpc_clients()
+    await close_ipfs_client()
+
 # ==================== BACKGROUND TASK: TX MONITORING ====================
 
 async def monitor_transaction_confirmation(job_id: int, tx_hash: str, max_attempts: int = 15):
@@ -590,7 +686,8 @@ async def get_wallet_balance(address: str):
     """Get GAS balance for Neo N3 address"""
     try:
         rpc_url = os.getenv("NEO_TESTNET_RPC", "https://testnet1.neo.coz.io:443/")
-        balance = get_gas_balance(rpc_url, address)
+        # urlopen-based RPC call; keep it off the event loop
+        balance = await asyncio.to_thread(get_gas_balance, rpc_url, address)
         
         return {
             "success": True,
@@ -636,7 +733,7 @@ async def estimate_gas_cost(request: GasEstimateRequest):
     try:
         # Get current balance
         rpc_url = os.getenv("NEO_TESTNET_RPC", "https://testnet1.neo.coz.io:443/")
-        current_balance = get_gas_balance(rpc_url, request.client_address)
+        current_balance = await asyncio.to_thread(get_gas_balance, rpc_url, request.client_address)
         
         # Platform fee calculation (5%)
         platform_fee = round(request.amount * 0.05, 2)
@@ -695,30 +792,30 @@ async def estimate_gas_cost(request: GasEstimateRequest):
 # ==================== JOB LISTING ENDPOINTS ====================
 
 @app.get("/api/jobs/available")
-async def list_available_jobs():
+async def list_available_jobs(request: Request):
     """Get all open jobs (filtered for worker public view)"""
     try:
         jobs = db.get_available_jobs()
-        return {
+        return etag_json_response(request, {
             "success": True,
             "count": len(jobs),
             "jobs": jobs
-        }
+        })
     except Exception as e:
         print(f"❌ Error listing jobs: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve available jobs")
 
 
 @app.get("/api/jobs/client/{address}")
-async def get_client_jobs(address: str = Depends(get_validated_address)):
+async def get_client_jobs(request: Request, address: str = Depends(get_validated_address)):
     """Get all jobs created by a client (with full details for owner)"""
     try:
         jobs = db.get_client_jobs(address)
-        return {
+        return etag_json_response(request, {
             "success": True,
             "count": len(jobs),
             "jobs": jobs
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -728,7 +825,7 @@ async def get_client_jobs(address: str = Depends(get_validated_address)):
 
 
 @app.get("/api/jobs/worker/{worker_address}/current")
-async def get_worker_active_jobs(worker_address: str):
+async def get_worker_active_jobs(worker_address: str, request: Request):
     """Get all active jobs for a worker (LOCKED + DISPUTED)"""
     try:
         # Validate address
@@ -736,7 +833,7 @@ async def get_worker_active_jobs(worker_address: str):
             return {"jobs": []}  # Return empty instead of error
         
         jobs = db.get_worker_active_jobs(worker_address)
-        return {"jobs": jobs}
+        return etag_json_response(request, {"jobs": jobs})
     except HTTPException:
         raise
     except Exception as e:
@@ -762,7 +859,7 @@ async def get_worker_history(worker_address: str):
 
 
 @app.get("/api/jobs/worker/{worker_address}/all")
-async def get_all_worker_jobs(worker_address: str):
+async def get_all_worker_jobs(worker_address: str, request: Request):
     """Get all jobs for a worker (active + completed + all statuses)"""
     try:
         # Validate address
@@ -770,7 +867,7 @@ async def get_all_worker_jobs(worker_address: str):
             return {"jobs": []}  # Return empty instead of error
         
         jobs = db.get_all_worker_jobs(worker_address)
-        return {"jobs": jobs}
+        return etag_json_response(request, {"jobs": jobs})
     except HTTPException:
         raise
     except Exception as e:
@@ -939,9 +1036,9 @@ async def retry_payment_release(job_id: int):
                 "db_status": job["status"]
             }
         
-        # Re-trigger payment release
+        # Re-trigger payment release (status checked above; skip the repeat read)
         print(f"   💰 Re-triggering release_funds on blockchain...")
-        release_result = await mcp.release_funds_on_chain(job_id=job_id)
+        release_result = await mcp.release_funds_on_chain(job_id=job_id, validate=False)
         
         if release_result["success"]:
             tx_hash = release_result["tx_hash"]
@@ -1075,7 +1172,7 @@ async def get_job_details(job_id: int):
 
 # ==================== AI ANALYSIS (Paralegal Agent) ====================
 
-@app.post("/api/jobs/analyze")
+@app.post("/api/jobs/analyze", response_model=JobAnalysisResponse)
 async def analyze_job(
     message: str = Form(...),
     reference_image: UploadFile = File(...),
@@ -1091,14 +1188,14 @@ async def analyze_job(
     Returns structured task breakdown, validation, and balance check
     """
     try:
-        image_bytes = await reference_image.read()
-
-        if len(image_bytes) > 10 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="Image too large. Maximum size is 10MB")
-
-        if not reference_image.content_type.startswith("image/"):
+        # Reject before reading any bytes; some clients omit the content type
+        if not (reference_image.content_type or "").startswith("image/"):
             raise HTTPException(status_code=400, detail="Invalid file type. Must be an image")
 
+        image_bytes = await read_upload_limited(
+            reference_image, too_large_detail="Image too large. Maximum size is 10MB"
+        )
+
         # 1. Paralegal analysis with location
         result = await analyze_job_request(
             message, 
@@ -1128,7 +1225,7 @@ async def analyze_job(
             else:
                 message_text = "Job analyzed successfully! Ready to create contract."
 
-        return JobAnalysisResponse(
+        response = JobAnalysisResponse(
             success=True,
             status=result["status"],
             data=result["data"],
@@ -1139,6 +1236,9 @@ async def analyze_job(
             balance_check=balance_check,
             verification_plan=result.get("verification_plan")
         )
+        # Serialize straight to JSON bytes with pydantic-core instead of
+        # FastAPI's jsonable_encoder -> dict -> json.dumps round trip
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
@@ -1150,42 +1250,7 @@ async def analyze_job(
 async def upload_to_ipfs_endpoint(file: UploadFile = File(...)):
     """Upload a file to IPFS and return the hash URL"""
     try:
-        print(f"\n📤 ===== IPFS UPLOAD REQUEST =====")
-        print(f"   Filename: {file.filename}")
-        print(f"   Content-Type: {file.content_type}")
-        
-        file_bytes = await file.read()
-        file_size_mb = len(file_bytes) / (1024 * 1024)
-        
-        print(f"   File size: {file_size_mb:.2f} MB ({len(file_bytes)} bytes)")
-        
-        if len(file_bytes) > 10 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="File too large. Maximum size is 10MB")
-        
-        if len(file_bytes) == 0:
-            raise HTTPException(status_code=400, detail="File is empty")
-            
-        # Generate a unique filename with timestamp to reduce collision probability
-        extension = file.filename.split('.')[-1] if '.' in file.filename else 'jpg'
-        filename = f"upload_{int(time.time())}_{os.urandom(4).hex()}.{extension}"
-        print(f"   Generated filename: {filename}")
-        
-        # Check credentials
-        print(f"   Checking Pinata credentials...")
-        pinata_key = os.getenv("PINATA_API_KEY")
-        has_secret = bool(os.getenv("PINATA_SECRET_KEY"))
-        has_jwt = bool(os.getenv("PINATA_JWT"))
-        print(f"   API Key: {pinata_key[:8] if pinata_key else 'None'}..., Secret: {'✓' if has_secret else '✗'}, JWT: {'✓' if has_jwt else '✗'}")
-        
-        print(f"   Calling upload_to_ipfs()...")
-        ipfs_url = upload_to_ipfs(file_bytes, filename)
-        
-        if not ipfs_url:
-            print(f"❌ IPFS upload returned None for {filename}")
-            raise HTTPException(status_code=500, detail="Failed to upload to IPFS - upload_to_ipfs() returned None")
-        
-        print(f"✅ IPFS upload successful: {ipfs_url}")
-        print(f"===================================\n")
+        ipfs_url = await pin_upload_to_ipfs(file)
         return {"success": True, "url": ipfs_url}
         
     except HTTPException:
@@ -1342,16 +1407,13 @@ async def assign_job(request: AssignJobRequest):
 async def upload_proof_image(file: UploadFile = File(...)):
     """Upload proof photo to IPFS"""
     try:
-        image_bytes = await file.read()
-        ipfs_url = upload_to_ipfs(image_bytes, filename=file.filename)
-        
-        if not ipfs_url:
-            raise HTTPException(status_code=500, detail="IPFS upload failed")
-        
+        ipfs_url = await pin_upload_to_ipfs(file, filename=file.filename)
         return {
             "success": True,
             "ipfs_url": ipfs_url
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1583,11 +1645,11 @@ async def verify_work_endpoint(
             raise HTTPException(status_code=400, detail="Worker location must include latitude and longitude")
 
         # Upload proof image
-        proof_bytes = await proof_image.read()
-        if len(proof_bytes) > 10 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="Proof image too large. Maximum 10MB")
+        proof_bytes = await read_upload_limited(
+            proof_image, too_large_detail="Proof image too large. Maximum 10MB"
+        )
 
-        proof_url = upload_to_ipfs(proof_bytes, f"proof_{job_id}.jpg")
+        proof_url = await upload_to_ipfs_async(proof_bytes, f"proof_{job_id}.jpg")
         if not proof_url:
             raise HTTPException(status_code=500, detail="Failed to upload proof image to IPFS")
 
@@ -198,6 +198,24 @@ def get_job_longitude(job_id: int) -> int:
     """Get job location longitude (scaled by 1000000)"""
     return get_int(_key(b"job_longitude", job_id))
 
+@public
+def get_job_full(job_id: int) -> list[Any]:
+    """
+    Get every job field in one call:
+    [status, client, worker, required, details, reference_urls, latitude, longitude]
+    """
+    job: list[Any] = [
+        get_int(_key(b"job_status", job_id)),
+        get_uint160(_key(b"job_client", job_id)),
+        get_uint160(_key(b"job_worker", job_id)),
+        get_int(_key(b"job_required", job_id)),
+        get_str(_key(b"job_details", job_id)),
+        get_str(_key(b"job_reference_urls", job_id)),
+        get_int(_key(b"job_latitude", job_id)),
+        get_int(_key(b"job_longitude", job_id))
+    ]
+    return job
+
 @public
 def get_agent_addr() -> UInt160:
     """Get the current agent (Admin Tribunal) address"""
@@ -1,31 +1,59 @@
 import asyncio
-import json
+import fcntl
+import re
 import sys
+import traceback
 from pathlib import Path
-from neo3.wallet.account import Account
-from neo3.api.wrappers import ChainFacade, GenericContract
-from neo3.api.helpers.signing import sign_with_account
-from neo3.network.payloads.verification import Signer
+
+import orjson
+from typing import Optional
+from neo3.api.wrappers import GenericContract
 from neo3.core import types
 from neo3.api import noderpc
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
+from utils.accounts import build_signing_facade, load_account
+from utils.env import load_env
+from utils.rpc_helpers import wait_for_tx
 from utils.ssl_helpers import create_testnet_ssl_context
 
 
+_VAULT_HASH_LINE = re.compile(r"^VAULT_CONTRACT_HASH=.*$", re.MULTILINE)
+
+
+def _extract_contract_hash(app_log) -> Optional[types.UInt160]:
+    """Return the deployed contract hash from the Deploy notification, or None"""
+    execution = app_log.execution
+    if execution.state != "HALT":
+        print(f"⚠️  Deployment transaction ended in {execution.state}: {execution.exception}")
+        return None
+    for notif in execution.notifications:
+        if notif.event_name == 'Deploy' and notif.state.value:
+            # Contract hash is in the first value of the notification state
+            return types.UInt160(notif.state.value[0].value)
+    return None
+
+
+def _is_minified(raw: bytes) -> bool:
+    """Cheap check for compact JSON: no newlines or separator padding"""
+    return b"\n" not in raw and b'": ' not in raw and b'", ' not in raw
+
+
+def _load_min_manifest(manifest_path: Path) -> str:
+    """Read the manifest and return it as compact JSON (single parse + dump)"""
+    raw = manifest_path.read_bytes()
+    if _is_minified(raw):
+        # Already compact (e.g. pre-minified by the build); skip the round-trip
+        return raw.decode()
+    return orjson.dumps(orjson.loads(raw)).decode()
+
+
 async def main():
     root = Path(__file__).resolve().parents[1]
     
     # Load environment variables
-    env = {}
-    for line in (root / ".env").read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            k, v = line.split("=", 1)
-            env[k.strip()] = v.strip()
+    env = load_env(root / ".env")
     
     rpc = env.get("NEO_TESTNET_RPC")
     deployer_wif = env.get("DEPLOYER_WIF")
@@ -39,7 +67,7 @@ async def main():
     print(f"🔒 SSL Context: {ssl_context.check_hostname=}, {ssl_context.verify_mode=}")
     
     # Load deployer account
-    deployer = Account.from_wif(deployer_wif)
+    deployer = load_account(deployer_wif)
     print(f"🔑 Deployer: {deployer.address}")
     
     # Load compiled contract files
@@ -50,14 +78,11 @@ async def main():
         print("❌ Contract files not found. Run compile_vault.py first.")
         sys.exit(1)
     
-    # Read NEF as bytes
-    with open(nef_path, "rb") as f:
-        nef_bytes = f.read()
-    
-    # Read manifest as minified JSON string
-    with open(manifest_path, "r") as f:
-        manifest_data = json.load(f)
-        manifest_json = json.dumps(manifest_data, separators=(',', ':'))
+    # Read NEF bytes and minified manifest JSON concurrently
+    nef_bytes, manifest_json = await asyncio.gather(
+        asyncio.to_thread(nef_path.read_bytes),
+        asyncio.to_thread(_load_min_manifest, manifest_path)
+    )
     
     print(f"📄 NEF size: {len(nef_bytes)} bytes")
     print(f"📄 Manifest size: {len(manifest_json)} bytes")
@@ -72,11 +97,7 @@ async def main():
         contract_mgmt = GenericContract(contract_mgmt_hash)
         
         # Setup ChainFacade with signer
-        facade = ChainFacade(rpc, receipt_timeout=30.0)
-        facade.add_signer(
-            sign_with_account(deployer),
-            Signer(deployer.script_hash)
-        )
+        facade = build_signing_facade(rpc, deployer)
         
         print("📡 Sending deployment transaction...")
         
@@ -87,57 +108,41 @@ async def main():
         
         print(f"\n✅ Deployment transaction sent!")
         print(f"   TX Hash: {tx_hash}")
-        print(f"   Waiting for confirmation (~20 seconds)...")
-        
-        # Wait for transaction to be included in a block
-        await asyncio.sleep(20)
+        print(f"   Waiting for confirmation...")
         
-        # Extract contract hash from transaction notification
-        print("📋 Extracting contract hash from transaction...")
+        # Extract contract hash from transaction notification once the
+        # transaction is in a block (same client reused by the poller)
         async with noderpc.NeoRpcClient(rpc) as client:
             try:
-                tx_hash_obj = types.UInt256.from_string(str(tx_hash))
-                app_log = await client.get_application_log_transaction(tx_hash_obj)
+                app_log = await wait_for_tx(client, tx_hash)
+                print("📋 Extracting contract hash from transaction...")
                 
-                # Look for Deploy notification
-                for notif in app_log.execution.notifications:
-                    if notif.event_name == 'Deploy':
-                        # Contract hash is in the first value of the notification state
-                        contract_hash = types.UInt160(notif.state.value[0].value)
-                        
-                        print(f"\n✅ Contract deployed successfully!")
-                        print(f"   Contract Hash: 0x{contract_hash}")
-                        print(f"   Gas Consumed: {app_log.execution.gas_consumed / 100_000_000:.8f} GAS")
-                        
-                        # Update .env with new contract hash
-                        env_path = root / ".env"
-                        env_lines = env_path.read_text().splitlines()
-                        
-                        # Remove old contract hash lines
-                        new_lines = []
-                        skip_next = False
-                        for line in env_lines:
-                            if "VAULT_CONTRACT_HASH" in line:
-                                skip_next = True
-                                continue
-                            if skip_next and (line.startswith("#") or not line.strip()):
-                                continue
-                            skip_next = False
-                            new_lines.append(line)
-                        
-                        # Add new contract hash
-                        new_lines.append("")
-                        new_lines.append("# Contract Deployment")
-                        new_lines.append(f"# TX: 0x{tx_hash}")
-                        new_lines.append(f"VAULT_CONTRACT_HASH=0x{contract_hash}")
-                        
-                        env_path.write_text("\n".join(new_lines) + "\n")
-                        
-                        print(f"\n📝 Contract hash saved to .env")
-                        print(f"\n🔍 View: https://testnet.neotube.io/contract/{contract_hash}")
-                        return
+                contract_hash = _extract_contract_hash(app_log)
+                if contract_hash is not None:
+                    print(f"\n✅ Contract deployed successfully!")
+                    print(f"   Contract Hash: 0x{contract_hash}")
+                    print(f"   Gas Consumed: {app_log.execution.gas_consumed / 100_000_000:.8f} GAS")
+                    
+                    # Replace VAULT_CONTRACT_HASH in .env in place (or append it
+                    # on first deploy) under an exclusive lock
+                    env_path = root / ".env"
+                    new_line = f"VAULT_CONTRACT_HASH=0x{contract_hash}"
+                    with open(env_path, "r+") as f:
+                        fcntl.flock(f, fcntl.LOCK_EX)
+                        text, count = _VAULT_HASH_LINE.subn(new_line, f.read())
+                        if count == 0:
+                            text = (
+                                text.rstrip() + "\n\n# Contract Deployment\n"
+                                f"# TX: 0x{tx_hash}\n{new_line}\n"
+                            )
+                        f.seek(0)
+                        f.write(text)
+                        f.truncate()
+                    
+                    print(f"\n📝 Contract hash saved to .env")
+                    print(f"\n🔍 View: https://testnet.neotube.io/contract/{contract_hash}")
+                    return
                 
-                # If we get here, no Deploy notification was found
                 print(f"⚠️  No Deploy notification found in transaction")
             
             except Exception as e:
@@ -152,7 +157,6 @@ async def main():
         
     except Exception as e:
         print(f"\n❌ Deployment failed: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
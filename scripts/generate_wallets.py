@@ -7,28 +7,23 @@ def main():
     project_root = Path(__file__).resolve().parents[1]
     env_path = project_root / ".env"
 
-    lines = []
+    wallets = {}
     for role in ROLES:
         acct = Account.create_new()
-        addr = acct.address
         if acct.private_key is None:
             raise SystemExit("Unexpected watch-only account; no private key generated")
-        wif = Account.private_key_to_wif(acct.private_key)
-        lines.append(f"{role}_WIF={wif}")
-        lines.append(f"{role}_ADDR={addr}")
-        lines.append("")
+        wallets[role] = (Account.private_key_to_wif(acct.private_key), acct.address)
 
+    # Whole block in a single write
+    block = "".join(f"{role}_WIF={wif}\n{role}_ADDR={addr}\n\n" for role, (wif, addr) in wallets.items())
     with open(env_path, "a") as f:
-        f.write("\n")
-        f.write("\n".join(lines))
-        f.write("\n")
+        f.write("\n" + block)
 
-    print("Appended 5 Neo N3 TestNet wallets to .env")
+    print(f"Appended {len(wallets)} Neo N3 TestNet wallets to .env")
     print("Addresses:")
-    for i in range(0, len(lines), 3):
-        addr_line = lines[i+1]
-        print(f"- {addr_line.split('=')[1]}")
+    for _, addr in wallets.values():
+        print(f"- {addr}")
     print(f"\nSaved: {env_path}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
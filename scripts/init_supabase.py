@@ -9,13 +9,17 @@ Usage:
 
 import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
-load_dotenv()
+# DATABASE_URL is the only setting this script needs; don't read .env when
+# the environment (Render, Docker, CI) already provides it
+if not os.getenv("DATABASE_URL"):
+    load_dotenv()
 
 from backend.database import Database
 
@@ -45,10 +49,11 @@ def init_database():
         # Test connection by querying
         with db.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM jobs")
-            job_count = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM disputes")
-            dispute_count = cursor.fetchone()[0]
+            # Both counts in one round trip
+            cursor.execute(
+                "SELECT (SELECT COUNT(*) FROM jobs), (SELECT COUNT(*) FROM disputes)"
+            )
+            job_count, dispute_count = cursor.fetchone()
             
         print(f"\n📊 Current data:")
         print(f"   Jobs: {job_count}")
@@ -64,7 +69,6 @@ def init_database():
         
     except Exception as e:
         print(f"\n❌ Initialization failed: {e}")
-        import traceback
         traceback.print_exc()
         
         print("\n💡 Common issues:")
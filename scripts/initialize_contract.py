@@ -1,30 +1,33 @@
 import asyncio
 import sys
+import traceback
 from pathlib import Path
-from neo3.wallet.account import Account
-from neo3.api.wrappers import ChainFacade, GenericContract
-from neo3.api.helpers.signing import sign_with_account
-from neo3.network.payloads.verification import Signer
+from neo3.api.wrappers import GenericContract
 from neo3.core import types
 from neo3.wallet import utils as wallet_utils
+from neo3.api import noderpc
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
+from utils.accounts import build_signing_facade, load_account
+from utils.env import load_env
+from utils.rpc_helpers import wait_for_tx, wait_for_txs
 from utils.ssl_helpers import create_testnet_ssl_context
 
 
+def _check_halted(tx_hash, app_log):
+    """Fail loudly if a confirmed transaction FAULTed"""
+    execution = app_log.execution
+    if execution.state != "HALT":
+        raise RuntimeError(f"Transaction {tx_hash} ended in {execution.state}: {execution.exception}")
+    print(f"   ✅ Confirmed: {tx_hash}")
+
+
 async def main():
     root = Path(__file__).resolve().parents[1]
     
     # Load environment variables
-    env = {}
-    for line in (root / ".env").read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            k, v = line.split("=", 1)
-            env[k.strip()] = v.strip()
+    env = load_env(root / ".env")
     
     rpc = env.get("NEO_TESTNET_RPC")
     deployer_wif = env.get("DEPLOYER_WIF")
@@ -44,7 +47,7 @@ async def main():
     print(f"🔒 SSL Context: verify_mode={ssl_context.verify_mode}")
     
     # Load deployer account
-    deployer = Account.from_wif(deployer_wif)
+    deployer = load_account(deployer_wif)
     print(f"🔑 Deployer: {deployer.address}")
     
     # Parse contract hash
@@ -65,58 +68,43 @@ async def main():
     print("   5. set_fee_bps(500)  # 5% fee")
     print()
     
+    # Build every call script up front, before any network I/O
+    set_owner_call = vault.call_function("set_owner", [deployer_script_hash])
+    # Steps 2-5 only require the owner, so they are sent back-to-back and
+    # their confirmations polled together (about one block instead of four)
+    steps = [
+        ("2️⃣  Setting agent...", vault.call_function("set_agent", [agent_script_hash])),
+        ("3️⃣  Setting treasury...", vault.call_function("set_treasury", [treasury_script_hash])),
+        # Use same agent address as arbiter for MVP
+        ("4️⃣  Setting arbiter...", vault.call_function("set_arbiter", [agent_script_hash])),
+        # 500 basis points = 5%
+        ("5️⃣  Setting fee to 5%...", vault.call_function("set_fee_bps", [500])),
+    ]
+    
     # Setup ChainFacade
-    facade = ChainFacade(rpc, receipt_timeout=30.0)
-    facade.add_signer(
-        sign_with_account(deployer),
-        Signer(deployer.script_hash)
-    )
+    facade = build_signing_facade(rpc, deployer)
     
     try:
-        # Step 1: Set Owner
-        print("1️⃣  Setting owner...")
-        tx1 = await facade.invoke_fast(
-            vault.call_function("set_owner", [deployer_script_hash])
-        )
-        print(f"   ✅ Transaction sent: {tx1}")
-        print("   ⏳ Waiting for confirmation...")
-        await asyncio.sleep(20)
-        
-        # Step 2: Set Agent
-        print("\n2️⃣  Setting agent...")
-        tx2 = await facade.invoke_fast(
-            vault.call_function("set_agent", [agent_script_hash])
-        )
-        print(f"   ✅ Transaction sent: {tx2}")
-        print("   ⏳ Waiting for confirmation...")
-        await asyncio.sleep(20)
-        
-        # Step 3: Set Treasury
-        print("\n3️⃣  Setting treasury...")
-        tx3 = await facade.invoke_fast(
-            vault.call_function("set_treasury", [treasury_script_hash])
-        )
-        print(f"   ✅ Transaction sent: {tx3}")
-        print("   ⏳ Waiting for confirmation...")
-        await asyncio.sleep(20)
-        
-        # Step 4: Set Arbiter (use same agent address for MVP)
-        print("\n4️⃣  Setting arbiter...")
-        tx4 = await facade.invoke_fast(
-            vault.call_function("set_arbiter", [agent_script_hash])
-        )
-        print(f"   ✅ Transaction sent: {tx4}")
-        print("   ⏳ Waiting for confirmation...")
-        await asyncio.sleep(20)
+        # One RPC client reused to poll every confirmation
+        async with noderpc.NeoRpcClient(rpc) as client:
+            # Step 1: Set Owner
+            print("1️⃣  Setting owner...")
+            tx1 = await facade.invoke_fast(set_owner_call)
+            print(f"   ✅ Transaction sent: {tx1}")
+            print("   ⏳ Waiting for confirmation...")
+            _check_halted(tx1, await wait_for_tx(client, tx1))
         
-        # Step 5: Set Fee (500 basis points = 5%)
-        print("\n5️⃣  Setting fee to 5%...")
-        tx5 = await facade.invoke_fast(
-            vault.call_function("set_fee_bps", [500])
-        )
-        print(f"   ✅ Transaction sent: {tx5}")
-        print("   ⏳ Waiting for confirmation...")
-        await asyncio.sleep(20)
+            txs = []
+            for label, call in steps:
+                print(f"\n{label}")
+                tx = await facade.invoke_fast(call)
+                print(f"   ✅ Transaction sent: {tx}")
+                txs.append(tx)
+            
+            print("\n⏳ Waiting for confirmations...")
+            app_logs = await wait_for_txs(client, txs)
+            for tx, app_log in zip(txs, app_logs):
+                _check_halted(tx, app_log)
         
         print("\n🎉 Contract initialization complete!")
         print("\n📋 Contract State:")
@@ -130,7 +118,6 @@ async def main():
         
     except Exception as e:
         print(f"\n❌ Initialization failed: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -0,0 +1,24 @@
+"""Account and signing-facade helpers shared by the deployment scripts."""
+
+import functools
+
+from neo3.api.helpers.signing import sign_with_account
+from neo3.api.wrappers import ChainFacade
+from neo3.network.payloads.verification import Signer
+from neo3.wallet.account import Account
+
+
+@functools.lru_cache(maxsize=8)
+def load_account(wif: str) -> Account:
+    """Decode a WIF into an Account (cached: key derivation is an EC scalar multiplication)"""
+    return Account.from_wif(wif)
+
+
+def build_signing_facade(rpc: str, account: Account, receipt_timeout: float = 30.0) -> ChainFacade:
+    """Create a ChainFacade that signs transactions with account (CalledByEntry scope)"""
+    facade = ChainFacade(rpc, receipt_timeout=receipt_timeout)
+    facade.add_signer(
+        sign_with_account(account),
+        Signer(account.script_hash)
+    )
+    return facade
@@ -0,0 +1,32 @@
+"""Shared .env loading for deployment scripts.
+
+Parsed with python-dotenv's dotenv_values (the same parser the backend
+uses via load_dotenv), so quoting, escapes and `export` prefixes behave
+identically everywhere. Results are cached per file and invalidated when
+the file's mtime changes, so long-lived importers (e.g. the backend using
+check_balances) don't re-read and re-parse .env on every call.
+"""
+
+import functools
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+# Project-root .env shared by the scripts, resolved once at import
+DEFAULT_ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
+
+@functools.lru_cache(maxsize=8)
+def _load_env_cached(path_str, mtime_ns):
+    # Keys without a value (bare `KEY` lines) come back as None; skip them
+    return {k: v for k, v in dotenv_values(path_str).items() if v is not None}
+
+
+def load_env(path):
+    """Return the parsed .env at path as a fresh dict.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(path)
+    return dict(_load_env_cached(str(path), path.stat().st_mtime_ns))
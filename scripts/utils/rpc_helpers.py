@@ -0,0 +1,136 @@
+"""Neo N3 RPC helpers shared by the deployment and test scripts.
+
+Transactions sent with invoke_fast return as soon as the node accepts
+them; use wait_for_tx instead of fixed sleeps to block only until the
+transaction is actually in a block.
+"""
+
+import asyncio
+
+import orjson
+from neo3.api import noderpc
+from neo3.core import types
+
+# Some providers meter per call inside a batch; keep each POST small
+MAX_BATCH_SIZE = 10
+
+
+def _to_uint256(tx_hash):
+    if isinstance(tx_hash, types.UInt256):
+        return tx_hash
+    return types.UInt256.from_string(str(tx_hash))
+
+
+async def _post(client, payload):
+    """POST a JSON-RPC payload over the client's session, encoding/decoding with orjson"""
+    async with client.session.post(
+        client.url,
+        data=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+    ) as resp:
+        return orjson.loads(await resp.read())
+
+
+async def _get_app_log(client, tx_hash):
+    """getapplicationlog for one transaction (orjson-parsed)"""
+    res = await _post(client, {
+        "jsonrpc": "2.0", "id": 0, "method": "getapplicationlog", "params": [f"0x{tx_hash}"]
+    })
+    if "error" in res:
+        raise noderpc.JsonRpcError(**res["error"])
+    return noderpc.TransactionApplicationLogResponse.from_json(res["result"])
+
+
+async def wait_for_tx(client, tx_hash, timeout: float = 60.0):
+    """Poll with backoff until the transaction's application log exists (tx is in a block).
+
+    Args:
+        client: Open noderpc.NeoRpcClient
+        tx_hash: types.UInt256 or hex string (with or without 0x)
+        timeout: Seconds to wait before giving up
+
+    Returns:
+        The transaction's application log
+
+    Raises:
+        TimeoutError: If the transaction is not confirmed within timeout
+    """
+    tx_hash = _to_uint256(tx_hash)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 1.0
+    while True:
+        try:
+            return await _get_app_log(client, tx_hash)
+        except noderpc.JsonRpcError as e:
+            if "Unknown" not in e.message:
+                raise
+        if loop.time() + delay > deadline:
+            raise TimeoutError(f"Transaction {tx_hash} not confirmed within {timeout:.0f} seconds")
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, 5.0)
+
+
+async def _batch_get_app_logs(client, tx_hashes):
+    """Fetch several application logs in one JSON-RPC batch POST.
+
+    Returns a list aligned with tx_hashes holding the parsed log, or None
+    for transactions that are not in a block yet.
+    """
+    batch = [
+        {"jsonrpc": "2.0", "id": i, "method": "getapplicationlog", "params": [f"0x{h}"]}
+        for i, h in enumerate(tx_hashes)
+    ]
+    responses = await _post(client, batch)
+    if not isinstance(responses, list) or len(responses) != len(tx_hashes):
+        raise noderpc.JsonRpcError(-32600, "RPC node rejected batch request")
+    logs = [None] * len(tx_hashes)
+    for res in responses:
+        error = res.get("error")
+        if error:
+            if "Unknown" not in error.get("message", ""):
+                raise noderpc.JsonRpcError(**error)
+            continue
+        logs[res["id"]] = noderpc.TransactionApplicationLogResponse.from_json(res["result"])
+    return logs
+
+
+async def wait_for_txs(client, tx_hashes, timeout: float = 60.0):
+    """Wait for several transactions, polling all of them per round in one batch.
+
+    Falls back to concurrent wait_for_tx calls if the node does not accept
+    JSON-RPC batches.
+
+    Returns:
+        Application logs in the same order as tx_hashes
+
+    Raises:
+        TimeoutError: If any transaction is not confirmed within timeout
+    """
+    tx_hashes = [_to_uint256(h) for h in tx_hashes]
+    logs = [None] * len(tx_hashes)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 1.0
+    while True:
+        pending = [i for i, log in enumerate(logs) if log is None]
+        try:
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                chunk = pending[start:start + MAX_BATCH_SIZE]
+                results = await _batch_get_app_logs(client, [tx_hashes[i] for i in chunk])
+                for i, log in zip(chunk, results):
+                    logs[i] = log
+        except noderpc.JsonRpcError as e:
+            if "batch" not in e.message:
+                raise
+            remaining = deadline - loop.time()
+            fetched = await asyncio.gather(*(wait_for_tx(client, tx_hashes[i], remaining) for i in pending))
+            for i, log in zip(pending, fetched):
+                logs[i] = log
+        if all(log is not None for log in logs):
+            return logs
+        if loop.time() + delay > deadline:
+            missing = ", ".join(str(tx_hashes[i]) for i, log in enumerate(logs) if log is None)
+            raise TimeoutError(f"Transactions not confirmed within {timeout:.0f} seconds: {missing}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, 5.0)
@@ -6,14 +6,20 @@ Provides secure, environment-aware SSL configuration that:
 - Fails fast in production to prevent MITM vulnerabilities
 """
 
+import functools
 import ssl
 import os
 import sys
 
 
+@functools.lru_cache(maxsize=1)
 def create_testnet_ssl_context():
     """Create SSL context for testnet with optional verification bypass.
     
+    Built once per process: loading the CA bundle dominates the cost, and
+    NETWORK_MODE / TESTNET_ALLOW_INSECURE don't change while a script runs.
+    Callers must not mutate the returned context.
+    
     Returns:
         ssl.SSLContext: Configured context for RPC client usage
         
@@ -1,23 +1,19 @@
 import asyncio
 import sys
+import traceback
 from pathlib import Path
 from neo3.api.wrappers import ChainFacade, GenericContract
 from neo3.core import types
 from neo3.wallet import utils as wallet_utils
 
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from utils.env import DEFAULT_ENV_PATH, load_env
+
 
 async def main():
-    root = Path(__file__).resolve().parents[1]
-    
     # Load environment variables
-    env = {}
-    for line in (root / ".env").read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            k, v = line.split("=", 1)
-            env[k.strip()] = v.strip()
+    env = load_env(DEFAULT_ENV_PATH)
     
     rpc = env.get("NEO_TESTNET_RPC")
     contract_hash_str = env.get("VAULT_CONTRACT_HASH")
@@ -42,49 +38,36 @@ async def main():
         print("📊 Reading contract state...")
         print()
         
-        # Get owner
-        owner_receipt = await facade.test_invoke(vault.call_function("get_owner", []))
-        if owner_receipt.result and owner_receipt.result.stack:
-            owner_hash = types.UInt160(owner_receipt.result.stack[0].value)
-            owner_addr = wallet_utils.script_hash_to_address(owner_hash)
-            expected_owner = env.get("DEPLOYER_ADDR", "")
-            status = "✅" if owner_addr == expected_owner else "⚠️"
-            print(f"Owner:     {status} {owner_addr}")
-            if owner_addr != expected_owner:
-                print(f"           Expected: {expected_owner}")
-        else:
-            print(f"Owner:     ❌ Not set (empty address)")
+        # (label, getter, .env key holding the expected address)
+        address_checks = [
+            ("Owner", "get_owner", "DEPLOYER_ADDR"),
+            ("Agent", "get_agent_addr", "AGENT_ADDR"),
+            ("Treasury", "get_treasury_addr", "TREASURY_ADDR"),
+        ]
         
-        # Get agent
-        agent_receipt = await facade.test_invoke(vault.call_function("get_agent_addr", []))
-        if agent_receipt.result and agent_receipt.result.stack:
-            agent_hash = types.UInt160(agent_receipt.result.stack[0].value)
-            agent_addr = wallet_utils.script_hash_to_address(agent_hash)
-            expected_agent = env.get("AGENT_ADDR", "")
-            status = "✅" if agent_addr == expected_agent else "⚠️"
-            print(f"Agent:     {status} {agent_addr}")
-            if agent_addr != expected_agent:
-                print(f"           Expected: {expected_agent}")
-        else:
-            print(f"Agent:     ❌ Not set (empty address)")
+        # All getters concatenated into one script: a single invokescript
+        # round trip, results split back per call (fee getter last)
+        receipt = await facade.test_invoke_multi(
+            [vault.call_function(getter, []) for _, getter, _ in address_checks]
+            + [vault.call_function("get_fee_bps", [])]
+        )
+        *address_results, fee_result = receipt.result
         
-        # Get treasury
-        treasury_receipt = await facade.test_invoke(vault.call_function("get_treasury_addr", []))
-        if treasury_receipt.result and treasury_receipt.result.stack:
-            treasury_hash = types.UInt160(treasury_receipt.result.stack[0].value)
-            treasury_addr = wallet_utils.script_hash_to_address(treasury_hash)
-            expected_treasury = env.get("TREASURY_ADDR", "")
-            status = "✅" if treasury_addr == expected_treasury else "⚠️"
-            print(f"Treasury:  {status} {treasury_addr}")
-            if treasury_addr != expected_treasury:
-                print(f"           Expected: {expected_treasury}")
-        else:
-            print(f"Treasury:  ❌ Not set (empty address)")
+        for (label, _, env_key), result in zip(address_checks, address_results):
+            prefix = f"{label + ':':<11}"
+            if not result.stack:
+                print(f"{prefix}❌ Not set (empty address)")
+                continue
+            addr = wallet_utils.script_hash_to_address(types.UInt160(result.stack[0].value))
+            expected = env.get(env_key, "")
+            status = "✅" if addr == expected else "⚠️"
+            print(f"{prefix}{status} {addr}")
+            if addr != expected:
+                print(f"           Expected: {expected}")
         
-        # Get fee
-        fee_receipt = await facade.test_invoke(vault.call_function("get_fee_bps", []))
-        if fee_receipt.result and fee_receipt.result.stack:
-            fee_bps = int(fee_receipt.result.stack[0].value)
+        # Fee
+        if fee_result.stack:
+            fee_bps = int(fee_result.stack[0].value)
             fee_percent = fee_bps / 100
             status = "✅" if fee_bps == 500 else "⚠️"
             print(f"Fee:       {status} {fee_bps} bps ({fee_percent}%)")
@@ -96,12 +79,7 @@ async def main():
         print()
         
         # Summary
-        all_set = all([
-            owner_receipt.result and owner_receipt.result.stack,
-            agent_receipt.result and agent_receipt.result.stack,
-            treasury_receipt.result and treasury_receipt.result.stack,
-            fee_receipt.result and fee_receipt.result.stack
-        ])
+        all_set = all(result.stack for result in receipt.result)
         if all_set:
             print("🎉 Contract is fully initialized and ready!")
             print()
@@ -115,7 +93,6 @@ async def main():
         
     except Exception as e:
         print(f"\n❌ Verification failed: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
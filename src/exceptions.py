@@ -10,6 +10,10 @@ class TransactionFailedException(NeoException):
         self.tx_hash = tx_hash
         self.exception = exception
         super().__init__(message)
+    
+    def __reduce__(self):
+        # Rebuild through __init__ with every field, not just the message
+        return (type(self), (str(self), self.tx_hash, self.exception))
 
 
 class ContractValidationException(NeoException):
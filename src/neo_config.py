@@ -1,46 +1,107 @@
+from enum import IntEnum
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
 import os
+import re
+import threading
+
+from neo3.core import types
+
+
+# Repo-root .env; resolved once here rather than on every instantiation
+_DEFAULT_ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
+
+# KEY=VALUE lines; blank lines and # comments never match. Surrounding
+# whitespace is trimmed, and later assignments win once fed to dict()
+_ENV_LINE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+# path -> (mtime_ns, parsed values); survives reset() so re-created
+# instances skip the read + parse while the file is unchanged
+_PARSED_CACHE: Dict[str, Tuple[int, Dict[str, str]]] = {}
+
+
+def _read_env_file(path: Path) -> Dict[str, str]:
+    """Parse a .env file (empty if missing), memoized on its mtime"""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    key = str(path)
+    cached = _PARSED_CACHE.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, dict(_ENV_LINE.findall(path.read_text())))
+        _PARSED_CACHE[key] = cached
+    return dict(cached[1])
+
+
+class Role(IntEnum):
+    """Wallet roles configured in .env; values index NeoConfig's credential tables"""
+    DEPLOYER = 0
+    AGENT = 1
+    CLIENT = 2
+    WORKER = 3
+    TREASURY = 4
+
+
+# Lowercase role name -> Role, for callers that still pass strings
+_ROLE_MAP: Dict[str, Role] = {role.name.lower(): role for role in Role}
+
+
+def _to_role(role: Union[Role, str]) -> Role:
+    if isinstance(role, Role):
+        return role
+    try:
+        return _ROLE_MAP[role.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown role: {role}") from None
 
 
 class NeoConfig:
+    # No per-instance __dict__; _instance/_lock stay class attributes
+    __slots__ = (
+        "env_path", "rpc_url", "contract_hash", "contract_hash_u160",
+        "deployer_wif", "deployer_addr",
+        "agent_wif", "agent_addr",
+        "client_wif", "client_addr",
+        "worker_wif", "worker_addr",
+        "treasury_wif", "treasury_addr",
+        "_wifs", "_addrs"
+    )
+    
     _instance: Optional['NeoConfig'] = None
+    _lock = threading.Lock()
     
     def __init__(self, env_path: Optional[Path] = None):
         if NeoConfig._instance is not None:
             raise RuntimeError("NeoConfig is a singleton. Use get_instance() instead.")
         
-        self.env_path = env_path or Path(__file__).resolve().parents[1] / ".env"
+        self._init_from_path(env_path)
+    
+    def _init_from_path(self, env_path: Optional[Path]):
+        self.env_path = env_path or _DEFAULT_ENV_PATH
         self._load_env()
     
     @classmethod
     def get_instance(cls, env_path: Optional[Path] = None) -> 'NeoConfig':
-        """Get or create singleton instance"""
+        """Get or create singleton instance (thread-safe, loads .env once)"""
         if cls._instance is None:
-            instance = cls.__new__(cls)
-            instance.env_path = env_path or Path(__file__).resolve().parents[1] / ".env"
-            instance._load_env()
-            cls._instance = instance
+            with cls._lock:
+                if cls._instance is None:
+                    instance = cls.__new__(cls)
+                    instance._init_from_path(env_path)
+                    cls._instance = instance
         return cls._instance
     
     @classmethod
     def reset(cls):
         """Reset singleton (useful for testing)"""
-        cls._instance = None
+        with cls._lock:
+            cls._instance = None
     
     def _load_env(self):
         """Load environment variables from .env file or environment variables"""
-        env = {}
-        
-        # Try to load from .env file if it exists (for local development)
-        if self.env_path.exists():
-            for line in self.env_path.read_text().splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    env[key.strip()] = value.strip()
+        # Load from .env file if it exists (for local development)
+        env = _read_env_file(self.env_path)
         
         # Override with actual environment variables (for production/deployment)
         # This allows Render/other platforms to set env vars directly
@@ -61,6 +122,8 @@ class NeoConfig:
         # Required settings
         self.rpc_url = self._get_required(env, "NEO_TESTNET_RPC")
         self.contract_hash = self._get_required(env, "VAULT_CONTRACT_HASH")
+        # Parsed once here (also validates the format) instead of by every consumer
+        self.contract_hash_u160 = types.UInt160.from_string(self.contract_hash)
         
         # Account credentials
         self.deployer_wif = env.get("DEPLOYER_WIF")
@@ -73,6 +136,22 @@ class NeoConfig:
         self.worker_addr = env.get("WORKER_ADDR")
         self.treasury_wif = env.get("TREASURY_WIF")
         self.treasury_addr = env.get("TREASURY_ADDR")
+        
+        # Credential tables indexed by Role for the accessors below
+        self._wifs = [
+            self.deployer_wif,
+            self.agent_wif,
+            self.client_wif,
+            self.worker_wif,
+            self.treasury_wif
+        ]
+        self._addrs = [
+            self.deployer_addr,
+            self.agent_addr,
+            self.client_addr,
+            self.worker_addr,
+            self.treasury_addr
+        ]
     
     def _get_required(self, env: dict, key: str) -> str:
         """Get required environment variable or raise error"""
@@ -81,16 +160,18 @@ class NeoConfig:
             raise ValueError(f"Required environment variable not found: {key}. Please set it in .env file or as an environment variable.")
         return value
     
-    def get_account_wif(self, role: str) -> str:
-        """Get WIF for a specific role (deployer, agent, client, worker, treasury)"""
-        wif = getattr(self, f"{role.lower()}_wif", None)
+    def get_account_wif(self, role: Union[Role, str]) -> str:
+        """Get WIF for a specific role (Role member or name: deployer, agent, client, worker, treasury)"""
+        role = _to_role(role)
+        wif = self._wifs[role]
         if not wif:
-            raise ValueError(f"WIF not found for role: {role}")
+            raise ValueError(f"WIF not found for role: {role.name.lower()}")
         return wif
     
-    def get_account_addr(self, role: str) -> str:
+    def get_account_addr(self, role: Union[Role, str]) -> str:
         """Get address for a specific role"""
-        addr = getattr(self, f"{role.lower()}_addr", None)
+        role = _to_role(role)
+        addr = self._addrs[role]
         if not addr:
-            raise ValueError(f"Address not found for role: {role}")
+            raise ValueError(f"Address not found for role: {role.name.lower()}")
         return addr
@@ -1,7 +1,15 @@
 import asyncio
-from typing import Optional, Dict, Any, List
+import contextlib
+import functools
+import sys
+import time
+from typing import Optional, Dict, Any, List, Tuple
+import orjson
 from neo3.wallet.account import Account
-from neo3.api.wrappers import ChainFacade, GenericContract
+from neo3 import vm
+from neo3.api import noderpc
+from neo3.api.wrappers import GenericContract
+from neo3.api.helpers import txbuilder
 from neo3.api.helpers.signing import sign_with_account
 from neo3.network.payloads.verification import Signer, WitnessScope
 from neo3.core import types
@@ -41,6 +49,198 @@ STATUS_NAMES = {
 }
 
 
+# Address <-> script hash conversions (base58check + hashing) are pure and
+# the app deals with a handful of wallets, so memoize them
+@functools.lru_cache(maxsize=256)
+def _address_to_script_hash(address: str) -> types.UInt160:
+    return wallet_utils.address_to_script_hash(address)
+
+
+@functools.lru_cache(maxsize=256)
+def _script_hash_to_address(script_hash: types.UInt160) -> str:
+    return wallet_utils.script_hash_to_address(script_hash)
+
+
+async def _gather_reads(*aws) -> list:
+    """
+    Await read-only calls concurrently (asyncio.TaskGroup on 3.11+,
+    asyncio.gather before that): the first failure cancels the rest so
+    their requests don't linger, and is re-raised as is rather than
+    wrapped in an ExceptionGroup.
+    """
+    if sys.version_info >= (3, 11):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(aw) for aw in aws]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return [task.result() for task in tasks]
+    
+    # gather alone leaves the other calls running after the first failure
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+_ZERO_UINT160_BYTES = bytes(20)
+
+
+def _parse_stack_item(item: noderpc.StackItem, kind: str) -> Any:
+    """
+    Decode one getter result by kind: 'int' (as is), 'address' (UInt160
+    bytes -> N3 address), 'utf8' (str) or 'urls' (comma-separated -> tuple).
+    """
+    value = item.value
+    if kind == "address":
+        # ByteString values are already bytes; empty/null means unset (zero hash)
+        return _script_hash_to_address(types.UInt160(data=value or _ZERO_UINT160_BYTES))
+    if kind == "utf8":
+        return value.decode('utf-8') if value else ""
+    if kind == "urls":
+        # One split; drops empties left by trailing/doubled commas in older jobs
+        return tuple(url for url in value.decode('utf-8').split(",") if url) if value else ()
+    return value
+
+
+def _is_missing_method_fault(result: noderpc.ExecutionResult, method: str) -> bool:
+    """
+    True if an invocation FAULTed because the deployed contract has no such
+    method (System.Contract.Call: 'Method "<name>" with N parameter(s)
+    doesn't exist in the contract ...'; older nodes: 'Method not found').
+    """
+    if result.state == "HALT" or not result.exception:
+        return False
+    message = result.exception
+    return method in message and ("doesn't exist" in message or "not found" in message.lower())
+
+
+def _is_false_result(result: noderpc.ExecutionResult) -> bool:
+    """True if the invocation's return value is the Boolean False"""
+    return bool(result.stack) and result.stack[-1].type == noderpc.StackItemType.BOOL \
+        and result.stack[-1].value is False
+
+
+async def _send_with_reads(send, *reads) -> Tuple[types.UInt256, list, Optional[BaseException]]:
+    """
+    Await a transaction send concurrently with the reads that describe it.
+    Plain gather with return_exceptions: a failed read neither cancels the
+    send nor loses its tx_hash once broadcast.
+    
+    Returns:
+        (tx_hash, read results, first read error or None)
+    
+    Raises:
+        Whatever the send raised (the reads are then irrelevant)
+    """
+    tx_hash, *results = await asyncio.gather(send, *reads, return_exceptions=True)
+    if isinstance(tx_hash, BaseException):
+        raise tx_hash
+    read_error = next((result for result in results if isinstance(result, BaseException)), None)
+    return tx_hash, results, read_error
+
+
+def _sent_without_details(tx_hash: types.UInt256, job_id: int, read_error: BaseException) -> Dict[str, Any]:
+    """Result for a broadcast transaction whose job details couldn't be read"""
+    return {
+        "success": True,
+        "tx_hash": str(tx_hash),
+        "job_id": job_id,
+        "details_error": str(read_error),
+        "note": "Transaction sent, but job details could not be read. Check status once confirmed."
+    }
+
+
+# Calls per concatenated script in get_jobs_bulk; keeps each invokescript
+# well inside the node's script size and gas limits
+_BULK_CHUNK_SIZE = 100
+
+# Kinds of the get_job_full items / per-field getters, in order
+_JOB_FIELD_KINDS = ("int", "address", "address", "int", "utf8", "urls", "int", "int")
+
+
+# One keep-alive RPC client per node URL, shared by every NeoMCP instance.
+# ChainFacade opens (and tears down) a new aiohttp session per call, i.e. a
+# fresh TCP+TLS handshake for every contract read and transaction.
+_shared_rpc_clients: Dict[str, tuple] = {}
+
+
+class _OrjsonRpcClient(noderpc.NeoRpcClient):
+    """NeoRpcClient that encodes requests and decodes responses with orjson"""
+    
+    async def _do_post(
+        self,
+        method: str,
+        params: Optional[list] = None,
+        id: int = 0,
+        jsonrpc_version: str = "2.0",
+    ):
+        # Same as NeoRpcClient._do_post, which calls RPCClient._post through
+        # super(NeoRpcClient, self) and so would skip a _post override here
+        request = {
+            "jsonrpc": jsonrpc_version,
+            "id": id,
+            "method": method,
+            "params": params if params else [],
+        }
+        async with self.session.post(
+            self.url,
+            data=orjson.dumps(request),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            payload = orjson.loads(await response.read())
+        if "error" in payload:
+            raise noderpc.JsonRpcError(**payload["error"])
+        return payload["result"]
+
+
+def _close_foreign_rpc_client(client_loop: asyncio.AbstractEventLoop, client: noderpc.NeoRpcClient) -> None:
+    """
+    Close a shared client bound to another event loop. Its session can only
+    be closed on that loop: schedule it there if the loop is still running,
+    otherwise nothing will run it again, so close the connector directly.
+    """
+    if client.session.closed:
+        return
+    if client_loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.close(), client_loop)
+        return
+    with contextlib.suppress(RuntimeError):
+        # A closed loop can't schedule the transport callbacks; the
+        # connector is marked closed before that point either way
+        client.session.connector.close()
+
+
+def _get_shared_rpc_client(rpc_url: str) -> noderpc.NeoRpcClient:
+    """Return the shared client for rpc_url, recreating it if closed or bound to another event loop"""
+    loop = asyncio.get_running_loop()
+    entry = _shared_rpc_clients.get(rpc_url)
+    if entry is not None:
+        client_loop, client = entry
+        if client_loop is loop and not client.session.closed:
+            return client
+        if client_loop is not loop:
+            # Don't leak the old session (and its pooled connections)
+            _close_foreign_rpc_client(client_loop, client)
+    client = _OrjsonRpcClient(rpc_url)
+    _shared_rpc_clients[rpc_url] = (loop, client)
+    return client
+
+
+async def close_shared_rpc_clients() -> None:
+    """Close the shared read clients (call on shutdown)"""
+    loop = asyncio.get_running_loop()
+    for rpc_url, (client_loop, client) in list(_shared_rpc_clients.items()):
+        if client_loop is loop:
+            await client.close()
+        else:
+            _close_foreign_rpc_client(client_loop, client)
+        del _shared_rpc_clients[rpc_url]
+
+
 class NeoMCP:
     def __init__(self, config: Optional[NeoConfig] = None):
         """
@@ -50,45 +250,180 @@ class NeoMCP:
             config: Optional NeoConfig instance. If None, uses singleton.
         """
         self.config = config or NeoConfig.get_instance()
-        self.contract_hash = types.UInt160.from_string(
-            self.config.contract_hash.replace("0x", "")
-        )
+        self.contract_hash = self.config.contract_hash_u160
         self.contract = GenericContract(self.contract_hash)
-        self._facade_cache: Dict[str, ChainFacade] = {}
+        self._signer_cache: Dict[str, tuple] = {}
+        self._addr_to_role: Dict[str, str] = {}
+        self.refresh_addresses()
+        # (monotonic timestamp, config) from the last get_contract_config read
+        self._config_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._config_ttl = 300.0
+        # method -> script tail following the pushed job_id (see _call_script)
+        self._job_script_tails: Dict[str, bytes] = {}
+        # Cleared the first time get_job_full is missing from the deployed contract
+        self._job_full_supported = True
+        # Last job_id handed out by _next_job_id
+        self._last_job_id = 0
+    
+    def refresh_addresses(self) -> None:
+        """Rebuild the address -> role map from the configured wallet addresses"""
+        addr_to_role = {}
+        for role in ['client', 'worker', 'agent', 'deployer', 'treasury']:
+            try:
+                # setdefault: if roles share an address they share a key, so any one signs
+                addr_to_role.setdefault(self.config.get_account_addr(role), role)
+            except ValueError:
+                # Role not configured in this deployment
+                pass
+        self._addr_to_role = addr_to_role
     
-    def _get_facade(self, role: str) -> ChainFacade:
+    def _get_signer(self, role: str) -> tuple:
         """
-        Get or create a ChainFacade for a specific role with signing configured.
-        Cached to avoid recreating connections.
+        Get or create the (signing function, Signer) pair for a role.
+        Cached so the WIF is decoded and the key derived only once.
         
         Args:
             role: One of 'agent', 'client', 'worker', 'deployer', 'treasury'
         
         Returns:
-            Configured ChainFacade instance
+            Signing pair for _invoke_fast
         """
-        if role in self._facade_cache:
-            return self._facade_cache[role]
+        if role in self._signer_cache:
+            return self._signer_cache[role]
         
         # Load account for role
         wif = self.config.get_account_wif(role)
         account = Account.from_wif(wif)
         
-        # Create facade
-        facade = ChainFacade(self.config.rpc_url, receipt_timeout=30.0)
-        facade.add_signer(
+        signing_pair = (
             sign_with_account(account),
             Signer(account.script_hash, scope=WitnessScope.GLOBAL)
         )
         
-        self._facade_cache[role] = facade
-        return facade
+        self._signer_cache[role] = signing_pair
+        return signing_pair
+    
+    async def _invoke_fast(self, signing_pair: tuple, call) -> types.UInt256:
+        """
+        Build, sign and send a contract call without waiting for a receipt.
+        
+        Same steps as ChainFacade.invoke_fast (node-calculated fees, default
+        validity window) but over the shared keep-alive client, so a
+        transaction's five RPCs don't start with a fresh TLS handshake.
+        
+        Returns:
+            Transaction hash (acceptance only; execution is not awaited)
+        
+        Raises:
+            TransactionFailedException: If the call FAULTs or returns False
+                in the fee dry run (nothing is broadcast)
+        """
+        client = _get_shared_rpc_client(self.config.rpc_url)
+        builder = txbuilder.TxBuilder(client, call.script)
+        await builder.init()
+        builder.add_signer(*signing_pair)
+        await builder.set_valid_until_block()
+        
+        # System fee dry run (what TxBuilder.calculate_system_fee does), but
+        # refuse to broadcast when the contract's own checks would FAULT
+        dry_run = await client.invoke_script(builder.tx.script, builder.tx.signers)
+        if dry_run.state != "HALT":
+            raise TransactionFailedException(
+                f"Contract rejected transaction: {dry_run.exception}",
+                exception=dry_run.exception
+            )
+        # The vault's write methods refuse a call (wrong status, caller or
+        # amount) by returning False, which still HALTs: sent, it'd be a no-op
+        if _is_false_result(dry_run):
+            raise TransactionFailedException("Contract rejected transaction: call returned False")
+        builder.tx.system_fee = dry_run.gas_consumed
+        
+        # Network fee depends on the witnesses: sign once with a placeholder
+        # fee, let the node price it, then sign again over the real fee
+        builder.tx.network_fee = 999
+        await builder.build_and_sign()
+        await builder.calculate_network_fee()
+        builder.tx.witnesses = []
+        
+        tx = await builder.build_and_sign()
+        return await client.send_transaction(tx)
+    
+    async def _send(self, signing_pair: tuple, call, action: str) -> types.UInt256:
+        """_invoke_fast with any failure reported as TransactionFailedException("Failed to <action>: ...")"""
+        try:
+            return await self._invoke_fast(signing_pair, call)
+        except TransactionFailedException:
+            raise
+        except Exception as e:
+            raise TransactionFailedException(f"Failed to {action}: {str(e)}")
+    
+    def _call_script(self, method: str, args: list) -> bytes:
+        """
+        Script for a contract call. Calls taking only a job_id are built as
+        push(job_id) + a per-method tail computed once; the tail (PACK,
+        call flags, method name, contract hash, SYSCALL) never changes.
+        """
+        if len(args) == 1 and type(args[0]) is int:
+            tail = self._job_script_tails.get(method)
+            if tail is None:
+                # PUSH0 is a single opcode, so the tail is everything after it
+                tail = self.contract.call_function(method, [0]).script[1:]
+                self._job_script_tails[method] = tail
+            return vm.ScriptBuilder().emit_push(args[0]).to_array() + tail
+        return self.contract.call_function(method, args).script
+    
+    async def _test_invoke(self, method: str, args: list) -> noderpc.ExecutionResult:
+        """
+        Run a read-only contract call over the shared keep-alive RPC client.
+        
+        Returns:
+            Raw execution result (state, stack)
+        """
+        client = _get_shared_rpc_client(self.config.rpc_url)
+        return await client.invoke_script(self._call_script(method, args), [])
+    
+    async def _test_invoke_multi(self, calls: List[tuple]) -> List[Any]:
+        """
+        Run several read-only contract calls as one concatenated script,
+        so N getters cost a single invokescript round trip.
+        
+        Args:
+            calls: (method, args) pairs; each method must return one value
+        
+        Returns:
+            One stack item per call, in order
+        """
+        script = b"".join(self._call_script(method, args) for method, args in calls)
+        client = _get_shared_rpc_client(self.config.rpc_url)
+        result = await client.invoke_script(script, [])
+        if result.state != "HALT" or len(result.stack) != len(calls):
+            raise ContractValidationException(
+                f"Read-only call failed ({result.state}): {result.exception}"
+            )
+        return result.stack
+    
+    def warm_up(self, roles: Optional[List[str]] = None) -> None:
+        """
+        Pre-build the signing pairs for the given roles (default: agent).
+        Call at service startup so WIF decoding and key derivation happen
+        once at boot instead of on the first payment request.
+        """
+        for role in roles or ['agent']:
+            try:
+                self._get_signer(role)
+            except ValueError:
+                # Role not configured in this deployment; built lazily (and fails) on use
+                pass
+    
+    async def close(self) -> None:
+        """Close the shared keep-alive RPC clients (reopened lazily on next use)"""
+        await close_shared_rpc_clients()
+    
+    async def __aenter__(self) -> 'NeoMCP':
+        return self
     
-    def _get_read_facade(self) -> ChainFacade:
-        """Get facade for read-only operations (no signing needed)"""
-        if 'readonly' not in self._facade_cache:
-            self._facade_cache['readonly'] = ChainFacade(self.config.rpc_url)
-        return self._facade_cache['readonly']
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
     
     # ==================== READ OPERATIONS ====================
     
@@ -102,18 +437,47 @@ class NeoMCP:
         Returns:
             Dict with status code and name
         """
-        facade = self._get_read_facade()
-        receipt = await facade.test_invoke(
-            self.contract.call_function("get_job_status", [job_id])
-        )
+        result = await self._test_invoke("get_job_status", [job_id])
         
-        status_code = receipt.result.stack[0].value
+        status_code = result.stack[0].value
         return {
             "job_id": job_id,
             "status_code": status_code,
             "status_name": STATUS_NAMES.get(status_code, "UNKNOWN")
         }
     
+    async def get_jobs_bulk(self, job_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get the status of many jobs at once.
+        
+        The get_job_status calls are concatenated into one script per
+        _BULK_CHUNK_SIZE jobs (one invokescript round trip each, chunks
+        sent concurrently) instead of one request per job.
+        
+        Args:
+            job_ids: Job identifiers
+        
+        Returns:
+            Same dicts as get_job_status, in job_ids order
+        """
+        chunks = [
+            job_ids[start:start + _BULK_CHUNK_SIZE]
+            for start in range(0, len(job_ids), _BULK_CHUNK_SIZE)
+        ]
+        stacks = await _gather_reads(*(
+            self._test_invoke_multi([("get_job_status", [job_id]) for job_id in chunk])
+            for chunk in chunks
+        ))
+        return [
+            {
+                "job_id": job_id,
+                "status_code": item.value,
+                "status_name": STATUS_NAMES.get(item.value, "UNKNOWN")
+            }
+            for chunk, stack in zip(chunks, stacks)
+            for job_id, item in zip(chunk, stack)
+        ]
+    
     async def get_job_details(self, job_id: int) -> Dict[str, Any]:
         """
         Get full job details from blockchain for AI verification.
@@ -125,37 +489,34 @@ class NeoMCP:
         Returns:
             Dict with all job information including location
         """
-        facade = self._get_read_facade()
-        
-        # Parallel reads for efficiency - now including location
-        status_result, client_result, worker_result, amount_result, \
-        details_result, urls_result, lat_result, lng_result = await asyncio.gather(
-            facade.test_invoke(self.contract.call_function("get_job_status", [job_id])),
-            facade.test_invoke(self.contract.call_function("get_job_client", [job_id])),
-            facade.test_invoke(self.contract.call_function("get_job_worker", [job_id])),
-            facade.test_invoke(self.contract.call_function("get_job_required", [job_id])),
-            facade.test_invoke(self.contract.call_function("get_job_details", [job_id])),
-            facade.test_invoke(self.contract.call_function("get_job_reference_urls", [job_id])),
-            facade.test_invoke(self.contract.call_function("get_job_latitude", [job_id])),
-            facade.test_invoke(self.contract.call_function("get_job_longitude", [job_id]))
-        )
+        items = None
+        if self._job_full_supported:
+            # Aggregate getter: every field in one contract call
+            result = await self._test_invoke("get_job_full", [job_id])
+            if result.state == "HALT" and result.stack and result.stack[0].type == noderpc.StackItemType.ARRAY:
+                items = result.stack[0].value
+            elif _is_missing_method_fault(result, "get_job_full"):
+                # Deployed contract predates get_job_full; use the per-field getters from now on
+                self._job_full_supported = False
+            # Any other failure may be transient: fall back for this call only
+        if items is None:
+            # All eight getters in one script / one RPC round trip
+            items = await self._test_invoke_multi([
+                ("get_job_status", [job_id]),
+                ("get_job_client", [job_id]),
+                ("get_job_worker", [job_id]),
+                ("get_job_required", [job_id]),
+                ("get_job_details", [job_id]),
+                ("get_job_reference_urls", [job_id]),
+                ("get_job_latitude", [job_id]),
+                ("get_job_longitude", [job_id])
+            ])
         
         # Parse results
-        status_code = status_result.result.stack[0].value
-        # Fix: Convert bytes to UInt160 properly
-        client_bytes = client_result.result.stack[0].value
-        worker_bytes = worker_result.result.stack[0].value
-        client_hash = types.UInt160(data=bytes(client_bytes)) if client_bytes else types.UInt160.zero()
-        worker_hash = types.UInt160(data=bytes(worker_bytes)) if worker_bytes else types.UInt160.zero()
-        amount = amount_result.result.stack[0].value
-        details = details_result.result.stack[0].value.decode('utf-8') if details_result.result.stack[0].value else ""
-        urls = urls_result.result.stack[0].value.decode('utf-8') if urls_result.result.stack[0].value else ""
-        latitude_int = lat_result.result.stack[0].value
-        longitude_int = lng_result.result.stack[0].value
-        
-        # Convert addresses
-        client_addr = wallet_utils.script_hash_to_address(client_hash)
-        worker_addr = wallet_utils.script_hash_to_address(worker_hash)
+        status_code, client_addr, worker_addr, amount, details, \
+        reference_urls, latitude_int, longitude_int = [
+            _parse_stack_item(item, kind) for item, kind in zip(items, _JOB_FIELD_KINDS)
+        ]
         
         # Convert GPS coordinates back to float (divide by 1,000,000)
         latitude = latitude_int / 1_000_000 if latitude_int else 0.0
@@ -170,7 +531,7 @@ class NeoMCP:
             "amount_locked": amount,
             "amount_gas": amount / 100_000_000,  # Convert to GAS
             "details": details,
-            "reference_urls": urls.split(",") if urls else [],
+            "reference_urls": reference_urls,
             "latitude": latitude,
             "longitude": longitude
         }
@@ -180,32 +541,53 @@ class NeoMCP:
         Get contract configuration (owner, agent, treasury, fee).
         
         Returns:
-            Dict with contract settings
+            Dict with contract settings (cached for _config_ttl seconds;
+            these only change through owner transactions)
         """
-        facade = self._get_read_facade()
-        
-        owner_result, agent_result, treasury_result, fee_result = await asyncio.gather(
-            facade.test_invoke(self.contract.call_function("get_owner", [])),
-            facade.test_invoke(self.contract.call_function("get_agent_addr", [])),
-            facade.test_invoke(self.contract.call_function("get_treasury_addr", [])),
-            facade.test_invoke(self.contract.call_function("get_fee_bps", []))
-        )
-        
-        owner_hash = types.UInt160(owner_result.result.stack[0].value)
-        agent_hash = types.UInt160(agent_result.result.stack[0].value)
-        treasury_hash = types.UInt160(treasury_result.result.stack[0].value)
-        fee_bps = fee_result.result.stack[0].value
-        
-        return {
-            "owner": wallet_utils.script_hash_to_address(owner_hash),
-            "agent": wallet_utils.script_hash_to_address(agent_hash),
-            "treasury": wallet_utils.script_hash_to_address(treasury_hash),
+        if self._config_cache is not None:
+            fetched_at, cached = self._config_cache
+            if time.monotonic() - fetched_at < self._config_ttl:
+                return dict(cached)
+        
+        # All four getters in one script / one RPC round trip
+        owner_item, agent_item, treasury_item, fee_item = await self._test_invoke_multi([
+            ("get_owner", []),
+            ("get_agent_addr", []),
+            ("get_treasury_addr", []),
+            ("get_fee_bps", [])
+        ])
+        
+        owner_hash = types.UInt160(owner_item.value)
+        agent_hash = types.UInt160(agent_item.value)
+        treasury_hash = types.UInt160(treasury_item.value)
+        fee_bps = fee_item.value
+        
+        config = {
+            "owner": _script_hash_to_address(owner_hash),
+            "agent": _script_hash_to_address(agent_hash),
+            "treasury": _script_hash_to_address(treasury_hash),
             "fee_bps": fee_bps,
             "fee_percentage": fee_bps / 100
         }
+        self._config_cache = (time.monotonic(), config)
+        return dict(config)
+    
+    def invalidate_config_cache(self) -> None:
+        """Drop the cached contract config (call after changing owner/agent/treasury/fee)"""
+        self._config_cache = None
     
     # ==================== WRITE OPERATIONS ====================
     
+    def _next_job_id(self) -> int:
+        """
+        Timestamp-based job_id, strictly increasing within this process:
+        two jobs created in the same second get consecutive IDs instead of
+        colliding. No await, so it is atomic on the event loop.
+        """
+        job_id = max(int(time.time()), self._last_job_id + 1)
+        self._last_job_id = job_id
+        return job_id
+    
     async def create_job_on_chain(
         self,
         client_address: str,
@@ -213,7 +595,8 @@ class NeoMCP:
         reference_photos: List[str],
         amount: float,
         latitude: float = 0.0,
-        longitude: float = 0.0
+        longitude: float = 0.0,
+        validate: bool = True
     ) -> Dict[str, Any]:
         """
         Create a new job and lock funds atomically (API-friendly).
@@ -225,27 +608,30 @@ class NeoMCP:
             amount: Amount in GAS to lock (e.g., 10.0 for 10 GAS)
             latitude: Job location latitude (e.g., 37.335708)
             longitude: Job location longitude (e.g., -121.886665)
+            validate: Check on chain that the generated job_id is unused,
+                and move to the next ID if it isn't. IDs are unique within
+                this process; the check covers other processes/instances
+                creating jobs in the same second. A collision it misses (or
+                with False) makes create_job return False in the dry run, so
+                the send raises TransactionFailedException and nothing is
+                broadcast.
         
         Returns:
             Dict with transaction result and job_id
         """
-        import time
-        
         # Generate job_id from timestamp
-        job_id = int(time.time())
+        job_id = self._next_job_id()
         
-        # Pre-validation: Check if job already exists
-        existing = await self.get_job_status(job_id)
-        if existing['status_code'] != STATUS_NONE:
-            # Retry with incremented ID
-            job_id += 1
+        # Pre-validation: Check if job already exists (the send would refuse a
+        # duplicate ID too, but this way we can retry instead of failing)
+        if validate:
+            existing = await self.get_job_status(job_id)
+            if existing['status_code'] != STATUS_NONE:
+                # Retry with the next ID
+                job_id = self._next_job_id()
         
         # Find which role has this address
-        client_role = None
-        for role in ['client', 'worker', 'agent', 'deployer', 'treasury']:
-            if self.config.get_account_addr(role) == client_address:
-                client_role = role
-                break
+        client_role = self._addr_to_role.get(client_address)
         
         if not client_role:
             return {
@@ -254,7 +640,7 @@ class NeoMCP:
                 "job_id": job_id
             }
         
-        client_script_hash = wallet_utils.address_to_script_hash(client_address)
+        client_script_hash = _address_to_script_hash(client_address)
         
         # Convert GAS to Fixed8 format (1 GAS = 100_000_000)
         amount_int = int(amount * 100_000_000)
@@ -263,39 +649,36 @@ class NeoMCP:
         latitude_int = int(latitude * 1_000_000)
         longitude_int = int(longitude * 1_000_000)
         
-        # Format reference URLs
-        urls_str = ",".join(reference_photos)
+        # Format reference URLs (normalized here so reads need no cleanup)
+        urls_str = ",".join(url for url in map(str.strip, reference_photos) if url)
         
-        # Get facade with client signing
-        facade = self._get_facade(client_role)
+        # Get client signer
+        signing_pair = self._get_signer(client_role)
         
-        try:
-            # Invoke transaction (fast - doesn't wait for receipt)
-            tx_hash = await facade.invoke_fast(
-                self.contract.call_function(
-                    "create_job",
-                    [job_id, client_script_hash, amount_int, description, urls_str, latitude_int, longitude_int]
-                )
-            )
-            
-            return {
-                "success": True,
-                "tx_hash": str(tx_hash),
-                "job_id": job_id,
-                "client": client_address,
-                "amount": amount,
-                "note": "Transaction sent. Wait ~15s then check status."
-            }
+        # Invoke transaction (fast - doesn't wait for receipt)
+        tx_hash = await self._send(
+            signing_pair,
+            self.contract.call_function(
+                "create_job",
+                [job_id, client_script_hash, amount_int, description, urls_str, latitude_int, longitude_int]
+            ),
+            "create job"
+        )
         
-        except TransactionFailedException:
-            raise
-        except Exception as e:
-            raise TransactionFailedException(f"Failed to create job: {str(e)}")
+        return {
+            "success": True,
+            "tx_hash": str(tx_hash),
+            "job_id": job_id,
+            "client": client_address,
+            "amount": amount,
+            "note": "Transaction sent. Wait ~15s then check status."
+        }
     
     async def assign_worker_on_chain(
         self,
         job_id: int,
-        worker_address: str
+        worker_address: str,
+        validate: bool = True
     ) -> Dict[str, Any]:
         """
         Assign worker to a job (first-come-first-served, API-friendly).
@@ -303,26 +686,27 @@ class NeoMCP:
         Args:
             job_id: Job to claim
             worker_address: Worker Neo N3 address
+            validate: Read the job status first and return a descriptive
+                error if it isn't OPEN. With False the contract's own check
+                still applies: its dry run returns False, which raises
+                TransactionFailedException and nothing is broadcast.
         
         Returns:
             Dict with transaction result
         """
         # Pre-validation: Check job is OPEN
-        status = await self.get_job_status(job_id)
-        if status['status_code'] != STATUS_OPEN:
-            return {
-                "success": False,
-                "error": f"Job must be OPEN to assign worker. Current: {status['status_name']}",
-                "job_id": job_id,
-                "current_status": status['status_name']
-            }
+        if validate:
+            status = await self.get_job_status(job_id)
+            if status['status_code'] != STATUS_OPEN:
+                return {
+                    "success": False,
+                    "error": f"Job must be OPEN to assign worker. Current: {status['status_name']}",
+                    "job_id": job_id,
+                    "current_status": status['status_name']
+                }
         
         # Find which role has this address
-        worker_role = None
-        for role in ['worker', 'client', 'agent', 'deployer', 'treasury']:
-            if self.config.get_account_addr(role) == worker_address:
-                worker_role = role
-                break
+        worker_role = self._addr_to_role.get(worker_address)
         
         if not worker_role:
             return {
@@ -331,30 +715,26 @@ class NeoMCP:
                 "job_id": job_id
             }
         
-        worker_script_hash = wallet_utils.address_to_script_hash(worker_address)
+        worker_script_hash = _address_to_script_hash(worker_address)
         
-        # Get facade with worker signing
-        facade = self._get_facade(worker_role)
+        # Get worker signer
+        signing_pair = self._get_signer(worker_role)
         
-        try:
-            tx_hash = await facade.invoke_fast(
-                self.contract.call_function("assign_worker", [job_id, worker_script_hash])
-            )
-            
-            return {
-                "success": True,
-                "tx_hash": str(tx_hash),
-                "job_id": job_id,
-                "worker": worker_address,
-                "note": "Transaction sent. Wait ~15s then check status."
-            }
+        tx_hash = await self._send(
+            signing_pair,
+            self.contract.call_function("assign_worker", [job_id, worker_script_hash]),
+            "assign worker"
+        )
         
-        except TransactionFailedException:
-            raise
-        except Exception as e:
-            raise TransactionFailedException(f"Failed to assign worker: {str(e)}")
+        return {
+            "success": True,
+            "tx_hash": str(tx_hash),
+            "job_id": job_id,
+            "worker": worker_address,
+            "note": "Transaction sent. Wait ~15s then check status."
+        }
     
-    async def release_funds_on_chain(self, job_id: int) -> Dict[str, Any]:
+    async def release_funds_on_chain(self, job_id: int, validate: bool = True) -> Dict[str, Any]:
         """
         Release funds to worker after Admin Tribunal (agent role) verification.
         Only callable by AGENT role.
@@ -364,57 +744,103 @@ class NeoMCP:
         
         Args:
             job_id: Job to settle
+            validate: Check the job is LOCKED before sending. With False (for
+                callers that already checked) the transaction is sent at once,
+                concurrently with the reads for the payment breakdown. A
+                release the contract refuses (its dry run returns False)
+                raises TransactionFailedException and is not broadcast.
         
         Returns:
-            Dict with transaction result including payment breakdown
+            Dict with transaction result including payment breakdown. If the
+            reads fail after the transaction was sent, success and tx_hash
+            are still returned, with details_error instead of the breakdown.
         """
-        # Pre-validation: Get job details for verification
-        job_details = await self.get_job_details(job_id)
-        
-        # Check job is LOCKED (worker assigned, work in progress)
-        if job_details['status_code'] != STATUS_LOCKED:
-            return {
-                "success": False,
-                "error": f"Job must be LOCKED to release funds. Current: {job_details['status_name']}",
-                "job_id": job_id,
-                "current_status": job_details['status_name'],
-                "job_details": job_details
-            }
-        
-        # Get contract config for fee calculation
-        config = await self.get_contract_config()
+        # Get agent signer (requires agent signature)
+        signing_pair = self._get_signer('agent')
+        call = self.contract.call_function("release_funds", [job_id])
+        
+        if validate:
+            # Pre-validation: Get job details for verification, and contract
+            # config for the fee calculation, concurrently
+            job_details, config = await _gather_reads(
+                self.get_job_details(job_id),
+                self.get_contract_config()
+            )
+            
+            # Check job is LOCKED (worker assigned, work in progress)
+            if job_details['status_code'] != STATUS_LOCKED:
+                return {
+                    "success": False,
+                    "error": f"Job must be LOCKED to release funds. Current: {job_details['status_name']}",
+                    "job_id": job_id,
+                    "current_status": job_details['status_name'],
+                    "job_details": job_details
+                }
+            
+            tx_hash = await self._send(signing_pair, call, "release funds")
+        else:
+            # The reads see the pre-release state: the tx isn't in a block yet
+            tx_hash, (job_details, config), read_error = await _send_with_reads(
+                self._send(signing_pair, call, "release funds"),
+                self.get_job_details(job_id),
+                self.get_contract_config()
+            )
+            if read_error is not None:
+                return _sent_without_details(tx_hash, job_id, read_error)
         
         # Calculate payment breakdown
         total_amount = job_details['amount_locked']
         fee_amount = total_amount * config['fee_bps'] // 10000
         worker_amount = total_amount - fee_amount
         
-        # Get agent facade (requires agent signature)
-        facade = self._get_facade('agent')
+        return {
+            "success": True,
+            "tx_hash": str(tx_hash),
+            "job_id": job_id,
+            "worker": job_details['worker_address'],
+            "worker_paid_gas": worker_amount / 100_000_000,
+            "fee_collected_gas": fee_amount / 100_000_000,
+            "treasury": config['treasury'],
+            "note": "Transaction sent. Funds will be transferred once confirmed.",
+            "job_details": job_details
+        }
+    
+    async def release_funds_many(self, job_ids: List[int], validate: bool = True) -> List[Dict[str, Any]]:
+        """
+        Release funds for several jobs concurrently over the shared RPC client.
         
-        try:
-            tx_hash = await facade.invoke_fast(
-                self.contract.call_function("release_funds", [job_id])
-            )
-            
-            return {
-                "success": True,
-                "tx_hash": str(tx_hash),
-                "job_id": job_id,
-                "worker": job_details['worker_address'],
-                "worker_paid_gas": worker_amount / 100_000_000,
-                "fee_collected_gas": fee_amount / 100_000_000,
-                "treasury": config['treasury'],
-                "note": "Transaction sent. Funds will be transferred once confirmed.",
-                "job_details": job_details
-            }
+        Transactions are built, signed (agent signer, derived once) and sent
+        in parallel, so N releases take about one transaction's round trips
+        instead of N. Neo N3 has no per-account nonce ordering and each
+        release script differs by job_id, so the transactions don't conflict.
         
-        except TransactionFailedException:
-            raise
-        except Exception as e:
-            raise TransactionFailedException(f"Failed to release funds: {str(e)}")
+        Args:
+            job_ids: Jobs to settle (duplicates are released once)
+            validate: Passed to release_funds_on_chain
+        
+        Returns:
+            One result per unique job_id, in order. A job that wasn't sent
+            (including a release the contract refuses) gets {"success": False,
+            "error": ..., "job_id": ...}; a sent one keeps success and tx_hash
+            even if its detail reads failed (see release_funds_on_chain).
+        """
+        unique_ids = list(dict.fromkeys(job_ids))
+        results = await asyncio.gather(
+            *(self.release_funds_on_chain(job_id, validate=validate) for job_id in unique_ids),
+            return_exceptions=True
+        )
+        return [
+            {"success": False, "error": str(result), "job_id": job_id}
+            if isinstance(result, Exception) else result
+            for job_id, result in zip(unique_ids, results)
+        ]
     
-    async def refund_client_on_chain(self, job_id: int, arbiter_role: str = 'agent') -> Dict[str, Any]:
+    async def refund_client_on_chain(
+        self,
+        job_id: int,
+        arbiter_role: str = 'agent',
+        validate: bool = True
+    ) -> Dict[str, Any]:
         """
         Refund locked funds to client after dispute resolution.
         Only callable by arbiter role.
@@ -422,50 +848,55 @@ class NeoMCP:
         Args:
             job_id: Job to refund
             arbiter_role: Role with arbiter permissions (default: 'agent')
+            validate: Check the job is LOCKED or DISPUTED before sending
+                (see release_funds_on_chain)
         
         Returns:
-            Dict with transaction result
+            Dict with transaction result (details_error instead of the
+            refund amount if the read fails after sending)
         """
-        # Pre-validation: Get job details
-        job_details = await self.get_job_details(job_id)
+        # Get arbiter signer
+        signing_pair = self._get_signer(arbiter_role)
+        call = self.contract.call_function("refund_client", [job_id])
         
-        # Check job is LOCKED or DISPUTED
-        if job_details['status_code'] not in [STATUS_LOCKED, STATUS_DISPUTED]:
-            return {
-                "success": False,
-                "error": f"Job must be LOCKED or DISPUTED to refund. Current: {job_details['status_name']}",
-                "job_id": job_id,
-                "current_status": job_details['status_name']
-            }
-        
-        # Get arbiter facade
-        facade = self._get_facade(arbiter_role)
-        
-        try:
-            tx_hash = await facade.invoke_fast(
-                self.contract.call_function("refund_client", [job_id])
-            )
+        if validate:
+            # Pre-validation: Get job details
+            job_details = await self.get_job_details(job_id)
             
-            return {
-                "success": True,
-                "tx_hash": str(tx_hash),
-                "job_id": job_id,
-                "client": job_details['client_address'],
-                "refunded_amount_gas": job_details['amount_locked'] / 100_000_000,
-                "note": "Transaction sent. Full refund (no fee) will be processed.",
-                "job_details": job_details
-            }
+            # Check job is LOCKED or DISPUTED
+            if job_details['status_code'] not in [STATUS_LOCKED, STATUS_DISPUTED]:
+                return {
+                    "success": False,
+                    "error": f"Job must be LOCKED or DISPUTED to refund. Current: {job_details['status_name']}",
+                    "job_id": job_id,
+                    "current_status": job_details['status_name']
+                }
+            
+            tx_hash = await self._send(signing_pair, call, "refund client")
+        else:
+            tx_hash, (job_details,), read_error = await _send_with_reads(
+                self._send(signing_pair, call, "refund client"),
+                self.get_job_details(job_id)
+            )
+            if read_error is not None:
+                return _sent_without_details(tx_hash, job_id, read_error)
         
-        except TransactionFailedException:
-            raise
-        except Exception as e:
-            raise TransactionFailedException(f"Failed to refund client: {str(e)}")
+        return {
+            "success": True,
+            "tx_hash": str(tx_hash),
+            "job_id": job_id,
+            "client": job_details['client_address'],
+            "refunded_amount_gas": job_details['amount_locked'] / 100_000_000,
+            "note": "Transaction sent. Full refund (no fee) will be processed.",
+            "job_details": job_details
+        }
     
     async def arbiter_resolve_on_chain(
         self,
         job_id: int,
         approve_worker: bool,
-        arbiter_role: str = 'agent'
+        arbiter_role: str = 'agent',
+        validate: bool = True
     ) -> Dict[str, Any]:
         """
         Arbiter manually resolves a disputed job.
@@ -475,64 +906,70 @@ class NeoMCP:
             job_id: Job to resolve
             approve_worker: True to pay worker, False to refund client
             arbiter_role: Role with arbiter permissions (default: 'agent')
+            validate: Check the job is LOCKED or DISPUTED before sending
+                (see release_funds_on_chain)
         
         Returns:
-            Dict with transaction result and payment breakdown
+            Dict with transaction result and payment breakdown (details_error
+            instead of the breakdown if the reads fail after sending)
         """
-        # Pre-validation: Get job details
-        job_details = await self.get_job_details(job_id)
-        
-        # Check job is LOCKED or DISPUTED
-        if job_details['status_code'] not in [STATUS_LOCKED, STATUS_DISPUTED]:
-            return {
-                "success": False,
-                "error": f"Job must be LOCKED or DISPUTED to resolve. Current: {job_details['status_name']}",
-                "job_id": job_id,
-                "current_status": job_details['status_name']
-            }
-        
-        # Get contract config for fee calculation
-        config = await self.get_contract_config()
-        
-        # Calculate payment breakdown
-        total_amount = job_details['amount_locked']
-        fee_amount = total_amount * config['fee_bps'] // 10000
-        worker_amount = total_amount - fee_amount
-        
-        # Get arbiter facade
-        facade = self._get_facade(arbiter_role)
-        
-        try:
-            tx_hash = await facade.invoke_fast(
-                self.contract.call_function("arbiter_resolve", [job_id, approve_worker])
+        # Get arbiter signer
+        signing_pair = self._get_signer(arbiter_role)
+        call = self.contract.call_function("arbiter_resolve", [job_id, approve_worker])
+        
+        if validate:
+            # Pre-validation: Get job details, and contract config for the fee
+            # calculation, concurrently
+            job_details, config = await _gather_reads(
+                self.get_job_details(job_id),
+                self.get_contract_config()
             )
             
-            if approve_worker:
+            # Check job is LOCKED or DISPUTED
+            if job_details['status_code'] not in [STATUS_LOCKED, STATUS_DISPUTED]:
                 return {
-                    "success": True,
-                    "tx_hash": str(tx_hash),
+                    "success": False,
+                    "error": f"Job must be LOCKED or DISPUTED to resolve. Current: {job_details['status_name']}",
                     "job_id": job_id,
-                    "resolution": "APPROVED",
-                    "worker": job_details['worker_address'],
-                    "worker_paid_gas": worker_amount / 100_000_000,
-                    "fee_collected_gas": fee_amount / 100_000_000,
-                    "treasury": config['treasury'],
-                    "note": "Arbiter approved work. Funds released to worker.",
-                    "job_details": job_details
-                }
-            else:
-                return {
-                    "success": True,
-                    "tx_hash": str(tx_hash),
-                    "job_id": job_id,
-                    "resolution": "REFUNDED",
-                    "client": job_details['client_address'],
-                    "refunded_amount_gas": total_amount / 100_000_000,
-                    "note": "Arbiter refunded client. Full refund (no fee).",
-                    "job_details": job_details
+                    "current_status": job_details['status_name']
                 }
+            
+            tx_hash = await self._send(signing_pair, call, "resolve dispute")
+        else:
+            tx_hash, (job_details, config), read_error = await _send_with_reads(
+                self._send(signing_pair, call, "resolve dispute"),
+                self.get_job_details(job_id),
+                self.get_contract_config()
+            )
+            if read_error is not None:
+                return _sent_without_details(tx_hash, job_id, read_error)
         
-        except TransactionFailedException:
-            raise
-        except Exception as e:
-            raise TransactionFailedException(f"Failed to resolve dispute: {str(e)}")
+        # Calculate payment breakdown
+        total_amount = job_details['amount_locked']
+        fee_amount = total_amount * config['fee_bps'] // 10000
+        worker_amount = total_amount - fee_amount
+        
+        if approve_worker:
+            return {
+                "success": True,
+                "tx_hash": str(tx_hash),
+                "job_id": job_id,
+                "resolution": "APPROVED",
+                "worker": job_details['worker_address'],
+                "worker_paid_gas": worker_amount / 100_000_000,
+                "fee_collected_gas": fee_amount / 100_000_000,
+                "treasury": config['treasury'],
+                "note": "Arbiter approved work. Funds released to worker.",
+                "job_details": job_details
+            }
+        else:
+            return {
+                "success": True,
+                "tx_hash": str(tx_hash),
+                "job_id": job_id,
+                "resolution": "REFUNDED",
+                "client": job_details['client_address'],
+                "refunded_amount_gas": total_amount / 100_000_000,
+                "note": "Arbiter refunded client. Full refund (no fee).",
+                "job_details": job_details
+            }
@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+from neo3.core import types
+
+from src.exceptions import TransactionFailedException
+from src.neo_mcp import NeoMCP, STATUS_LOCKED
+
+
+TX_HASH = types.UInt256.zero()
+
+
+def _no_account(role):
+    raise ValueError(f"{role} not configured")
+
+
+def make_neo(monkeypatch, send, get_job_details):
+    """NeoMCP with the network calls replaced by the given coroutines"""
+    config = SimpleNamespace(
+        contract_hash_u160=types.UInt160.zero(),
+        rpc_url="http://localhost:10332",
+        get_account_addr=_no_account,
+    )
+    neo = NeoMCP(config)
+
+    async def get_contract_config():
+        return {"fee_bps": 500, "treasury": "NTreasury"}
+
+    monkeypatch.setattr(neo, "_get_signer", lambda role: (None, None))
+    monkeypatch.setattr(neo, "_send", send)
+    monkeypatch.setattr(neo, "get_job_details", get_job_details)
+    monkeypatch.setattr(neo, "get_contract_config", get_contract_config)
+    return neo
+
+
+def test_release_funds_many_keeps_tx_hash_when_read_fails_after_send(monkeypatch):
+    sent = []
+
+    async def send(signing_pair, call, action):
+        sent.append(call.script)
+        return TX_HASH
+
+    async def get_job_details(job_id):
+        if job_id == 2:
+            raise ConnectionError("node unavailable")
+        return {
+            "status_code": STATUS_LOCKED,
+            "amount_locked": 10_000_000_000,
+            "worker_address": "NWorker",
+        }
+
+    neo = make_neo(monkeypatch, send, get_job_details)
+    results = asyncio.run(neo.release_funds_many([1, 2], validate=False))
+
+    assert len(sent) == 2
+    assert results[0]["success"] is True
+    assert results[0]["worker_paid_gas"] == 95.0
+    # Broadcast before the read failed: still a success, with the hash
+    assert results[1]["success"] is True
+    assert results[1]["tx_hash"] == str(TX_HASH)
+    assert results[1]["job_id"] == 2
+    assert "node unavailable" in results[1]["details_error"]
+    assert "worker_paid_gas" not in results[1]
+
+
+def test_release_funds_many_reports_refused_release_as_failure(monkeypatch):
+    async def send(signing_pair, call, action):
+        raise TransactionFailedException("Contract rejected transaction: call returned False")
+
+    async def get_job_details(job_id):
+        return {"status_code": STATUS_LOCKED, "amount_locked": 0, "worker_address": "NWorker"}
+
+    neo = make_neo(monkeypatch, send, get_job_details)
+    results = asyncio.run(neo.release_funds_many([7], validate=False))
+
+    assert results == [{
+        "success": False,
+        "error": "Contract rejected transaction: call returned False",
+        "job_id": 7,
+    }]
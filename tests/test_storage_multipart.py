@@ -0,0 +1,35 @@
+from email import message_from_bytes
+
+from backend.agent.storage import _MultipartBody
+
+
+def parse(body):
+    raw = f"Content-Type: {body.content_type}\r\n\r\n".encode() + b"".join(body)
+    return message_from_bytes(raw).get_payload()
+
+
+def test_hostile_filename_cannot_inject_header_lines():
+    image = b"\xff\xd8jpeg-bytes\xff\xd9"
+    body = _MultipartBody(
+        {"pinataOptions": '{"cidVersion": 1}'},
+        "file",
+        'proof.jpg"\r\nX-Injected: yes\r\n\r\nfake-body',
+        image,
+        "image/jpeg",
+    )
+
+    parts = parse(body)
+    assert len(parts) == 2
+    file_part = parts[1]
+    assert file_part["X-Injected"] is None
+    assert file_part["Content-Type"] == "image/jpeg"
+    assert file_part["Content-Disposition"] == (
+        'form-data; name="file"; '
+        'filename="proof.jpg%22%0D%0AX-Injected: yes%0D%0A%0D%0Afake-body"'
+    )
+    assert file_part.get_payload(decode=True) == image
+
+
+def test_length_matches_streamed_body():
+    body = _MultipartBody({"a": "1"}, "file", "photo.jpg", b"x" * 200_000, "image/png")
+    assert len(body) == sum(len(part) for part in body)
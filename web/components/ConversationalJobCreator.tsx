@@ -261,24 +261,35 @@ export default function ConversationalJobCreator() {
         console.log(`[JobCreator] Image ${idx + 1}:`, img.file.name, 'Size:', (img.file.size / (1024 * 1024)).toFixed(2), 'MB');
       });
 
+      // Upload all images concurrently; total time is the slowest upload, not the sum
+      const results = await Promise.allSettled(
+        state.clientUploadedImages.map((img, idx) => {
+          console.log(`[JobCreator] Uploading image ${idx + 1}/${state.clientUploadedImages.length} to IPFS:`, img.file.name);
+          return apiClient.uploadToIpfs(img.file);
+        })
+      );
+
       const ipfsUrls: string[] = [];
+      let firstError: string | null = null;
 
-      for (let idx = 0; idx < state.clientUploadedImages.length; idx++) {
+      for (let idx = 0; idx < results.length; idx++) {
+        const result = results[idx];
         const img = state.clientUploadedImages[idx];
-        console.log(`[JobCreator] Uploading image ${idx + 1}/${state.clientUploadedImages.length} to IPFS:`, img.file.name);
-
-        try {
-          const url = await apiClient.uploadToIpfs(img.file);
-          console.log(`[JobCreator] ✅ Image ${idx + 1} uploaded successfully:`, url);
-          ipfsUrls.push(url);
-        } catch (error) {
-          console.error(`[JobCreator] ❌ Failed to upload image ${idx + 1}:`, error);
-          const errorMsg = error instanceof Error ? error.message : 'Unknown error';
+        if (result.status === 'fulfilled') {
+          console.log(`[JobCreator] ✅ Image ${idx + 1} uploaded successfully:`, result.value);
+          ipfsUrls.push(result.value);
+        } else {
+          console.error(`[JobCreator] ❌ Failed to upload image ${idx + 1}:`, result.reason);
+          const errorMsg = result.reason instanceof Error ? result.reason.message : 'Unknown error';
           toast.error(`Failed to upload ${img.file.name}: ${errorMsg}`);
-          throw new Error(`Image upload failed: ${errorMsg}`);
+          firstError = firstError ?? errorMsg;
         }
       }
 
+      if (firstError) {
+        throw new Error(`Image upload failed: ${firstError}`);
+      }
+
       console.log('[JobCreator] All IPFS uploads complete:', ipfsUrls);
 
       if (ipfsUrls.length === 0) {
@@ -10,6 +10,10 @@ import { showPaymentConfirmed } from '@/components/PaymentToast';
 const CLIENT_ADDR = process.env.NEXT_PUBLIC_CLIENT_ADDR || '';
 const WORKER_ADDR = process.env.NEXT_PUBLIC_WORKER_ADDR || '';
 
+// Cheap structural equality for API payloads; lets refreshes keep the previous
+// state object (and skip a re-render) when the server returned identical data
+const sameData = (a: unknown, b: unknown) => JSON.stringify(a) === JSON.stringify(b);
+
 const initialState: GlobalState = {
     userMode: null,
     currentUser: null,
@@ -151,18 +155,26 @@ export function AppProvider({ children }: { children: ReactNode }) {
         }
     };
 
+    // In-flight refresh shared by concurrent callers (WebSocket events, claim, mount).
+    // followUp is the single re-fetch queued by callers that arrived while it ran.
+    const inflightFetchRef = useRef<{ key: string; promise: Promise<void>; followUp?: Promise<void> } | null>(null);
+
     const fetchData = async () => {
         if (!state.walletAddress) return;
 
-        try {
-            // Fetch balance
+        // Only share a refresh for the same wallet and mode; a switch starts a new one
+        const fetchKey = `${state.walletAddress}:${state.userMode}`;
+
+        const fetchBalance = async () => {
             const balance = await apiClient.getWalletBalance(state.walletAddress);
-            setState(prev => ({ ...prev, walletBalance: balance }));
+            setState(prev => (prev.walletBalance === balance ? prev : { ...prev, walletBalance: balance }));
+        };
 
-            // Fetch jobs based on mode
+        const fetchJobs = async () => {
             if (state.userMode === 'client') {
                 const data = await apiClient.getClientJobs(state.walletAddress);
-                setState(prev => ({ ...prev, clientJobs: data.jobs || [] }));
+                const clientJobs = data.jobs || [];
+                setState(prev => (sameData(prev.clientJobs, clientJobs) ? prev : { ...prev, clientJobs }));
             } else {
                 const [availData, activeData, historyData, statsData] = await Promise.all([
                     apiClient.getAvailableJobs(),
@@ -170,17 +182,57 @@ export function AppProvider({ children }: { children: ReactNode }) {
                     apiClient.getAllWorkerJobs(state.walletAddress),
                     apiClient.getWorkerStats(state.walletAddress),
                 ]);
-                setState(prev => ({
-                    ...prev,
-                    availableJobs: availData.jobs || [],
-                    workerJobs: historyData.jobs || [],
-                    currentJobs: activeData.jobs || [],
-                    workerStats: statsData || prev.workerStats,
-                }));
+                setState(prev => {
+                    const next = {
+                        availableJobs: availData.jobs || [],
+                        workerJobs: historyData.jobs || [],
+                        currentJobs: activeData.jobs || [],
+                        workerStats: statsData || prev.workerStats,
+                    };
+                    const unchanged =
+                        sameData(prev.availableJobs, next.availableJobs) &&
+                        sameData(prev.workerJobs, next.workerJobs) &&
+                        sameData(prev.currentJobs, next.currentJobs) &&
+                        sameData(prev.workerStats, next.workerStats);
+                    return unchanged ? prev : { ...prev, ...next };
+                });
             }
-        } catch (error) {
-            console.error('Error fetching data:', error);
+        };
+
+        const startRefresh = (): Promise<void> => {
+            const refresh = (async () => {
+                try {
+                    // Balance and jobs are independent, fetch them concurrently
+                    await Promise.all([fetchBalance(), fetchJobs()]);
+                } catch (error) {
+                    console.error('Error fetching data:', error);
+                } finally {
+                    // With a follow-up queued, keep the entry until it takes over
+                    const current = inflightFetchRef.current;
+                    if (current?.promise === refresh && !current.followUp) {
+                        inflightFetchRef.current = null;
+                    }
+                }
+            })();
+
+            inflightFetchRef.current = { key: fetchKey, promise: refresh };
+            return refresh;
+        };
+
+        const inflight = inflightFetchRef.current;
+        if (inflight?.key === fetchKey) {
+            // The running fetch may have been sent before the change that triggered
+            // this call (claim, submit, WebSocket event): queue one more after it
+            // settles, shared by everyone who asks in the meantime
+            if (!inflight.followUp) {
+                inflight.followUp = inflight.promise.then(() =>
+                    inflightFetchRef.current === inflight ? startRefresh() : undefined
+                );
+            }
+            return inflight.followUp;
         }
+
+        return startRefresh();
     };
 
     // Keep fetchData ref up-to-date to prevent stale closures in WebSocket handler
@@ -1,4 +1,5 @@
 import { JobDict, WorkerStats } from './types';
+import { downscaleImage } from './utils';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
@@ -115,7 +116,7 @@ export class ApiClient {
 
     async uploadProofImage(file: File): Promise<string> {
         const formData = new FormData();
-        formData.append('file', file);
+        formData.append('file', await downscaleImage(file));
 
         const res = await fetch(`${this.baseUrl}/api/upload/proof`, {
             method: 'POST',
@@ -127,7 +128,7 @@ export class ApiClient {
 
     async uploadToIpfs(file: File): Promise<string> {
         const formData = new FormData();
-        formData.append('file', file);
+        formData.append('file', await downscaleImage(file));
 
         const res = await fetch(`${this.baseUrl}/api/ipfs/upload`, {
             method: 'POST',